@@ -1,7 +1,12 @@
 import pygame
 import math
+import numpy as np
+from spatial_hash import box_of_points, circle_around_box
 
 class Chain:
+    # Interpolated outline points per joint, lowered by the QualityGovernor under load
+    BODY_SEGMENTS = 15
+
     def __init__(self, start_pos, points, length, max_angle):
         self.joints = [(start_pos[0] + i * length, start_pos[1]) for i in range(points)]
         self.angles = [0] * points
@@ -11,6 +16,10 @@ class Chain:
         self.circle_radii = [20 - i * (15 / points) for i in range(points)]
         # Store previous positions for smoothing
         self.prev_joints = self.joints.copy()
+        # Joints before the last update and the blend drawn between them
+        self.step_joints = self.joints.copy()
+        self.render_joints = self.joints.copy()
+        self._update_bounds()
         
     def bezier_point(self, points, t):
         """Calculate point along a Bezier curve."""
@@ -72,17 +81,33 @@ class Chain:
                 self.joints[i][1] * (1 - smoothing_factor) + self.prev_joints[i][1] * smoothing_factor
             )
         self.prev_joints = self.joints.copy()
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """Cache the bounding box of the joints."""
+        self.aabb = box_of_points(self.joints)
+
+    @property
+    def bounding_circle(self):
+        """(x, y, radius) circle holding the joints, worked out on request."""
+        return circle_around_box(self.aabb, self.joints)
+
+    def joint_array(self):
+        """The joints as an (n, 2) array, for the collision kernels."""
+        return np.array(self.joints, dtype=float)
 
-    def get_body_points(self):
+    def get_body_points(self, joints=None):
         """Get smoothed left and right points for drawing the eel's body."""
+        if joints is None:
+            joints = self.joints
         left_points = []
         right_points = []
         
         # Create control points for the body curve
-        for i in range(len(self.joints)):
-            if i < len(self.joints) - 1:
-                dx = self.joints[i+1][0] - self.joints[i][0]
-                dy = self.joints[i+1][1] - self.joints[i][1]
+        for i in range(len(joints)):
+            if i < len(joints) - 1:
+                dx = joints[i+1][0] - joints[i][0]
+                dy = joints[i+1][1] - joints[i][1]
                 angle = math.atan2(dy, dx)
             else:
                 angle = self.angles[i]
@@ -91,26 +116,30 @@ class Chain:
             # Add some sinusoidal movement for more organic feel
             wave_offset = math.sin(pygame.time.get_ticks() * 0.01 + i * 0.5) * (radius * 0.2)
             
-            left_x = self.joints[i][0] + (radius + wave_offset) * math.cos(angle + math.pi/2)
-            left_y = self.joints[i][1] + (radius + wave_offset) * math.sin(angle + math.pi/2)
-            right_x = self.joints[i][0] + (radius - wave_offset) * math.cos(angle - math.pi/2)
-            right_y = self.joints[i][1] + (radius - wave_offset) * math.sin(angle - math.pi/2)
+            left_x = joints[i][0] + (radius + wave_offset) * math.cos(angle + math.pi/2)
+            left_y = joints[i][1] + (radius + wave_offset) * math.sin(angle + math.pi/2)
+            right_x = joints[i][0] + (radius - wave_offset) * math.cos(angle - math.pi/2)
+            right_y = joints[i][1] + (radius - wave_offset) * math.sin(angle - math.pi/2)
             
             left_points.append((left_x, left_y))
             right_points.append((right_x, right_y))
         
         # Apply interpolation for smoother curves
-        left_points = self.interpolate_points(left_points, 15)
-        right_points = self.interpolate_points(right_points, 15)
+        left_points = self.interpolate_points(left_points, self.BODY_SEGMENTS)
+        right_points = self.interpolate_points(right_points, self.BODY_SEGMENTS)
         
         return left_points, right_points
 
+    def interpolate(self, alpha):
+        self.render_joints = [
+            (previous[0] + (joint[0] - previous[0]) * alpha, previous[1] + (joint[1] - previous[1]) * alpha)
+            for previous, joint in zip(self.step_joints, self.joints)
+        ]
+
     def draw(self, screen, camera, color=(0, 150, 150)):
-        # Apply smoothing to joint positions
-        self.smooth_joints()
-        
-        # Get smoothed body points
-        left_points, right_points = self.get_body_points()
+        # Joints are smoothed once per simulation step (smooth_joints), so only
+        # the interpolated joints are read here
+        left_points, right_points = self.get_body_points(self.render_joints)
         
         # Convert points to screen space
         left_points = [camera.apply(pygame.Vector2(p)) for p in left_points]
@@ -118,17 +147,18 @@ class Chain:
         
         # Draw the main body
         points = left_points + list(reversed(right_points))
+        drawn = []
         if len(points) > 2:
             # Draw body with gradient effect
-            pygame.draw.polygon(screen, color, points)
-            pygame.draw.polygon(screen, (0, 130, 130), points, 2)  # Darker outline
+            drawn.append(pygame.draw.polygon(screen, color, points))
+            drawn.append(pygame.draw.polygon(screen, (0, 130, 130), points, 2))  # Darker outline
         
         # Draw smoother head
-        head_pos = camera.apply(pygame.Vector2(self.joints[0]))
+        head_pos = camera.apply(pygame.Vector2(self.render_joints[0]))
         head_radius = int(self.circle_radii[0])
         
         # Draw head with gradient effect
-        pygame.draw.circle(screen, (0, 170, 170), head_pos, head_radius)
+        head_rect = pygame.draw.circle(screen, (0, 170, 170), head_pos, head_radius)
         pygame.draw.circle(screen, (0, 190, 190), head_pos, head_radius - 4)
         
         # Draw more detailed eye
@@ -139,6 +169,8 @@ class Chain:
         # Add eye highlight
         highlight_pos = eye_pos + pygame.Vector2(-2, -2)
         pygame.draw.circle(screen, (255, 255, 255), highlight_pos, head_radius * 0.05)
+        # The eye sits inside the head, so the body and head cover everything drawn
+        return head_rect.unionall(drawn)
 
     # [Previous methods remain unchanged: constrain_distance, constrain_angle, update]
     def constrain_distance(self, point, anchor):
@@ -168,8 +200,10 @@ class Chain:
         return new_position, current_angle
 
     def update(self, mouse_pos):
+        self.step_joints = self.joints.copy()
         self.joints[0] = mouse_pos
         self.angles[0] = math.atan2(self.joints[1][1] - mouse_pos[1], self.joints[1][0] - mouse_pos[0])
         for i in range(1, len(self.joints)):
             next_position = self.constrain_distance(self.joints[i], self.joints[i-1])
-            self.joints[i], self.angles[i] = self.constrain_angle(next_position, self.joints[i-1], self.angles[i-1])
\ No newline at end of file
+            self.joints[i], self.angles[i] = self.constrain_angle(next_position, self.joints[i-1], self.angles[i-1])
+        self._update_bounds()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+from text_cache import render_text
 
 class DifficultySettings:
     def __init__(self):
@@ -35,14 +36,14 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.font.SysFont(None, 36)
+        self.font_size = 36
         
     def draw(self, screen):
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(screen, color, self.rect, border_radius=10)
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius=10)
         
-        text_surface = self.font.render(self.text, True, (0, 0, 0))
+        text_surface = render_text(self.text, self.font_size, (0, 0, 0))
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         
@@ -144,8 +145,7 @@ class MainMenu:
         screen.fill((255, 255, 255))
         
         # Draw title higher up
-        font = pygame.font.SysFont(None, 82)
-        title = font.render("Slime Run", True, (0, 0, 0))
+        title = render_text("Slime Run", 82, (0, 0, 0))
         title_rect = title.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 5))
         screen.blit(title, title_rect)
         
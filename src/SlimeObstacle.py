@@ -1,80 +1,111 @@
 import pygame
 import math
 from pygame import gfxdraw
+import numpy as np
+from narrowphase import first_segment_hit
+from points_view import PointsView
+from sim_lod import DORMANT, FULL, REDUCED, distance_to_rect
+from slime_pulse import PulseCycle
+from slime_world import SlimeWorld
+from spatial_hash import boxes_overlap, grow_box
 
 class SlimeObstacle:
-    def __init__(self, position, radius, points):
+    # Relaxation passes per simulation tier; dormant slimes are not stepped
+    LOD_ITERATIONS = {FULL: 20, REDUCED: 5}
+    # Spare room when the draw surface is (re)allocated, so pulses rarely outgrow it
+    SURFACE_PADDING = 16
+    # Whether to outline the highlight, turned off by the QualityGovernor under load
+    DRAW_HIGHLIGHT = True
+    PULSE_STRENGTH = 3.0
+
+    def __init__(self, position, radius, points, world=None, baked=False):
         self.position = pygame.Vector2(position)
         self.radius = radius
         self.points = points
         self.area = math.pi * radius * radius
         self.circumference = 2 * math.pi * radius
         self.segment_length = (self.circumference / points) * 0.95
-        self.current_points = []
-        self.old_points = []
-        for i in range(points):
-            angle = math.radians(360 / points * i)
-            point = pygame.Vector2(
-                position[0] + radius * math.cos(angle),
-                position[1] + radius * math.sin(angle)
-            )
-            self.current_points.append(point)
-            self.old_points.append(point.copy())
         self.time = 0
-        self.pulse_strength = 3.0
+        self.pulse_strength = self.PULSE_STRENGTH
         self.wobble_speed = 2.0
+        # The ring lives in a SlimeWorld so all slimes can be solved together
+        if world is None:
+            world = SlimeWorld(capacity=1, max_points=points, deferred=False)
+        self.world = world
+        self.slot = world.add_slime(position, radius, points, self.segment_length, self.pulse_strength)
+        # Baked slimes replay a precomputed pulse loop instead of being solved
+        self.baked = baked
+        if baked:
+            world.set_cycle(self.slot, PulseCycle.get(radius, points, self.pulse_strength))
+        self.current_points = PointsView(world, 'current_points', self.slot)
+        self.old_points = PointsView(world, 'old_points', self.slot)
+        self.render_points = PointsView(world, 'render_points', self.slot)
+        self.lod_tier = FULL
+        self.surface = None
 
     def update(self, delta_time):
         self.time += delta_time * self.wobble_speed
-        for i in range(self.points):
-            self.old_points[i] = self.current_points[i].copy()
-            angle = 360 / self.points * i
-            wobble = math.sin(self.time + math.radians(angle)) * self.pulse_strength
-            direction = (self.current_points[i] - self.position).normalize()
-            self.current_points[i] += direction * wobble
+        if self.lod_tier != DORMANT:
+            self.world.queue(self.slot, self.time, self.LOD_ITERATIONS[self.lod_tier])
+
+    def lod_distance(self, view):
+        """Gap between the slime and the `view` rect."""
+        return max(0, distance_to_rect(self.position, view) - self.radius)
+
+    def shape(self, camera):
+        """Screen-space ring, highlight and the rect around both, or None for too few points."""
+        if len(self.render_points) < 3:
+            return None
+        # Truncate like int() on each coordinate
+        points = (self.render_points.array() - tuple(camera.render_offset)).astype(int)
+        highlight = points[:len(points)//3 if self.DRAW_HIGHLIGHT else 0] - 5
+        corners = np.concatenate((points, highlight))
+        left, top = corners.min(axis=0).tolist()
+        right, bottom = corners.max(axis=0).tolist()
+        return points, highlight, pygame.Rect(left, top, right - left + 1, bottom - top + 1)
 
-        for _ in range(20):
-            for i in range(self.points):
-                next_i = (i + 1) % self.points
-                current = self.current_points[i]
-                next_point = self.current_points[next_i]
-                to_next = next_point - current
-                current_distance = to_next.length()
-                if current_distance > 0:
-                    correction = (current_distance - self.segment_length) / current_distance
-                    offset = to_next * correction * 0.5
-                    self.current_points[i] += offset
-                    self.current_points[next_i] -= offset
-                to_center = self.position - self.current_points[i]
-                distance = to_center.length()
-                if distance > self.radius:
-                    self.current_points[i] += to_center * 0.1
+    def draw_shape(self, surface, points, highlight, origin):
+        """Draw the ring and highlight with `origin` as the surface's top left."""
+        points = (points - origin).tolist()
+        gfxdraw.filled_polygon(surface, points, (0, 0, 0, 180))
+        gfxdraw.aapolygon(surface, points, (0, 0, 0, 255))
+        if len(highlight) > 2:
+            gfxdraw.aapolygon(surface, (highlight - origin).tolist(), (255, 255, 255, 100))
 
     def draw(self, screen, camera):
-        if len(self.current_points) < 3:
+        shape = self.shape(camera)
+        if shape is None:
+            return
+        points, highlight, rect = shape
+        if not rect.colliderect(screen.get_rect()):
             return
 
-        surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-
-        points = [camera.apply(p) for p in self.current_points]
-        gfxdraw.filled_polygon(surface, [(int(p.x), int(p.y)) for p in points], (0, 0, 0, 180))
-        gfxdraw.aapolygon(surface, [(int(p.x), int(p.y)) for p in points], (0, 0, 0, 255))
+        # Reuse one translucent surface sized to the slime, grown as it pulses
+        if (self.surface is None or self.surface.get_width() < rect.width or
+                self.surface.get_height() < rect.height):
+            size = (rect.width + self.SURFACE_PADDING, rect.height + self.SURFACE_PADDING)
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            self.surface.fill((0, 0, 0, 0), (0, 0, rect.width, rect.height))
+        self.draw_shape(self.surface, points, highlight, rect.topleft)
+        screen.blit(self.surface, rect.topleft, (0, 0, rect.width, rect.height))
 
-        highlight_points = [(p.x - 5, p.y - 5) for p in self.current_points[:len(self.current_points)//3]]
-        if len(highlight_points) > 2:
-            gfxdraw.aapolygon(surface, [(int(p[0]), int(p[1])) for p in highlight_points], (255, 255, 255, 100))
+    @property
+    def aabb(self):
+        """(left, top, right, bottom) of the ring as of its last physics step."""
+        return self.world.aabbs[self.slot].tolist()
 
-        screen.blit(surface, (0, 0))
+    @property
+    def bounding_circle(self):
+        """(x, y, radius) circle holding the ring as of its last physics step."""
+        return self.world.bounding_circle(self.slot)
 
     def check_collision(self, chain):
-        for joint in chain.joints:
-            joint_pos = pygame.Vector2(joint)
-            for i in range(len(self.current_points)):
-                p1 = self.current_points[i]
-                p2 = self.current_points[(i + 1) % len(self.current_points)]
-                if self.point_to_line_distance(joint_pos, p1, p2) < 15:
-                    return True
-        return False
+        if not boxes_overlap(grow_box(self.aabb, 15), chain.aabb):
+            return False
+        # Every joint against every edge of the ring, closing back to the first point
+        ring = self.current_points.array()
+        return first_segment_hit(chain.joint_array(), ring, np.roll(ring, -1, axis=0), 15) is not None
 
     def point_to_line_distance(self, point, line_start, line_end):
         line_vec = line_end - line_start
@@ -1,10 +1,10 @@
 # alert.py
 import math
-import pygame
 import numpy as np
+from overlay_layers import OverlayLayers
 
 class FuzzyAlert:
-    def __init__(self):
+    def __init__(self, layers=None):
         self.danger_level = 0
         self.max_alpha = 144
         
@@ -45,7 +45,9 @@ class FuzzyAlert:
             ('far', 'slow'): 0.0
         }
         
-        self.overlay = None
+        # Tint layers, shared with other overlays when passed in
+        self.layers = layers
+        self.alpha = 0
         self.danger_color = (255, 0, 0)
         
     def membership_function(self, value, peak, spread):
@@ -104,19 +106,15 @@ class FuzzyAlert:
             self.danger_level = max(0, self.danger_level - 0.04)
     
     def create_overlay(self, window_size):
-        if self.overlay is None or self.overlay.get_size() != window_size:
-            self.overlay = pygame.Surface(window_size, pygame.SRCALPHA)
-        
-        self.overlay.fill((0, 0, 0, 0))
-        
-        if self.danger_level > 0:
-            alpha = int(self.max_alpha * self.danger_level)
-            self.overlay.fill((self.danger_color[0], self.danger_color[1], 
-                             self.danger_color[2], alpha))
+        if self.layers is None or self.layers.size != tuple(window_size):
+            self.layers = OverlayLayers(window_size)
+        self.alpha = int(self.max_alpha * self.danger_level)
     
     def draw(self, screen):
-        if self.danger_level > 0:
-            screen.blit(self.overlay, (0, 0))
+        """Blit the danger tint; returns the rect drawn, or None if there is none."""
+        if self.layers is None or self.danger_level <= 0:
+            return None
+        return self.layers.draw(screen, self.danger_color, self.alpha)
 
 def calculate_distance(point1, point2):
     return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
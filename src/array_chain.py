@@ -0,0 +1,194 @@
+import math
+import numpy as np
+import pygame
+from Chain import Chain
+from points_view import PointsView
+
+def catmull_rom_basis(num_segments):
+    """Weights of p0..p3 for each of `num_segments` steps along a Catmull-Rom segment."""
+    t = np.arange(num_segments) / num_segments
+    t2 = t * t
+    t3 = t2 * t
+    return np.stack((-t3 + 2*t2 - t,
+                     3*t3 - 5*t2 + 2,
+                     -3*t3 + 4*t2 + t,
+                     t3 - t2), axis=1) / 2
+
+class ArrayChain(Chain):
+    """Chain whose joints, angles and body outline live in preallocated NumPy buffers.
+
+    Behaves like Chain, but smoothing, the body outline and the Catmull-Rom
+    interpolation are vectorized over all joints and write into buffers sized
+    once in the constructor, so chains with hundreds of joints cost a flat
+    amount per frame with no per-joint allocations. Following the head is still
+    a walk from joint to joint, since every joint is placed relative to the one
+    before it. The joint positions are the (n, 2) array `positions`.
+    """
+
+    def __init__(self, start_pos, points, length, max_angle, num_segments=None):
+        # `joints` reads the buffer as Vector2s, like the list of tuples Chain uses
+        self.joint_buffer = np.empty((1, points, 2))
+        self.num_points = np.array([points])
+        self.joints = PointsView(self, 'joint_buffer', 0)
+        self.positions = self.joint_buffer[0]
+        self.positions[:, 0] = start_pos[0] + np.arange(points) * length
+        self.positions[:, 1] = start_pos[1]
+        self.angles = np.zeros(points)
+        self.length = length
+        self.max_angle = max_angle
+        self.circle_radii = 20 - np.arange(points) * (15 / points)
+        self.prev_joints = self.positions.copy()
+        self.step_joints = self.positions.copy()
+        self.render_joints = self.positions.copy()
+        self._update_bounds()
+
+        # Catmull-Rom control point indices (clamped at both ends)
+        segment = np.arange(max(points - 2, 0))
+        self.control_indices = np.stack((np.maximum(segment - 1, 0), segment, segment + 1,
+                                         np.minimum(segment + 2, points - 1)), axis=1)
+        self.phases = np.arange(points) * 0.5
+        self.sides = np.empty((2, points, 2))
+        if num_segments is not None:
+            # A fixed segment count for this chain, ignoring BODY_SEGMENTS changes
+            self.BODY_SEGMENTS = num_segments
+        self._set_body_segments(self.BODY_SEGMENTS)
+
+    def _set_body_segments(self, num_segments):
+        """Size the Catmull-Rom basis and the outline buffer for `num_segments` steps."""
+        self.basis = catmull_rom_basis(num_segments)
+        self.outline = np.empty((2, len(self.control_indices) * num_segments + 2, 2))
+
+    def interpolate_points(self, points, num_segments=15, out=None):
+        """Vectorized Catmull-Rom through an (n, 2) array of points."""
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) < 3:
+            return points
+        if num_segments == len(self.basis) and len(points) == len(self.positions):
+            basis, indices = self.basis, self.control_indices
+        else:
+            basis = catmull_rom_basis(num_segments)
+            segment = np.arange(len(points) - 2)
+            indices = np.stack((np.maximum(segment - 1, 0), segment, segment + 1,
+                                np.minimum(segment + 2, len(points) - 1)), axis=1)
+        if out is None:
+            out = np.empty((len(indices) * num_segments + 2, 2))
+        out[0] = points[0]
+        # (steps, 4) basis times (segments, 4, 2) control points
+        np.matmul(basis, points[indices], out=out[1:-1].reshape(len(indices), len(basis), 2))
+        out[-1] = points[-1]
+        return out
+
+    def smooth_joints(self):
+        """Apply smoothing to joint positions."""
+        smoothing_factor = 0.3
+        self.positions *= 1 - smoothing_factor
+        self.positions += self.prev_joints * smoothing_factor
+        self.prev_joints[:] = self.positions
+        self._update_bounds()
+
+    def _update_bounds(self):
+        low, high = self.positions.min(axis=0), self.positions.max(axis=0)
+        self.aabb = (*low.tolist(), *high.tolist())
+
+    @property
+    def bounding_circle(self):
+        """(x, y, radius) circle holding the joints, worked out on request."""
+        low, high = self.positions.min(axis=0), self.positions.max(axis=0)
+        center = (low + high) / 2
+        offsets = self.positions - center
+        radius = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2).max()
+        return (*center.tolist(), float(radius))
+
+    def joint_array(self):
+        return self.positions
+
+    def get_body_points(self, joints=None):
+        """Left and right outlines of the eel's body, as views into `outline`."""
+        if joints is None:
+            joints = self.positions
+        angle = self.angles.copy()
+        delta = joints[1:] - joints[:-1]
+        angle[:-1] = np.arctan2(delta[:, 1], delta[:, 0])
+
+        radius = self.circle_radii
+        wave_offset = np.sin(pygame.time.get_ticks() * 0.01 + self.phases) * (radius * 0.2)
+        left, right = self.sides
+        left[:, 0] = joints[:, 0] + (radius + wave_offset) * np.cos(angle + math.pi/2)
+        left[:, 1] = joints[:, 1] + (radius + wave_offset) * np.sin(angle + math.pi/2)
+        right[:, 0] = joints[:, 0] + (radius - wave_offset) * np.cos(angle - math.pi/2)
+        right[:, 1] = joints[:, 1] + (radius - wave_offset) * np.sin(angle - math.pi/2)
+
+        if len(joints) < 3:
+            return left, right
+        if len(self.basis) != self.BODY_SEGMENTS:
+            self._set_body_segments(self.BODY_SEGMENTS)
+        left_points = self.interpolate_points(left, len(self.basis), out=self.outline[0])
+        right_points = self.interpolate_points(right, len(self.basis), out=self.outline[1])
+        return left_points, right_points
+
+    def interpolate(self, alpha):
+        np.subtract(self.positions, self.step_joints, out=self.render_joints)
+        self.render_joints *= alpha
+        self.render_joints += self.step_joints
+
+    def draw(self, screen, camera, color=(0, 150, 150)):
+        left_points, right_points = self.get_body_points(self.render_joints)
+        offset = (camera.render_offset.x, camera.render_offset.y)
+
+        # Outline goes down the left side and back up the right side
+        points = np.concatenate((left_points, right_points[::-1])) - offset
+        drawn = []
+        if len(points) > 2:
+            points = points.tolist()
+            drawn.append(pygame.draw.polygon(screen, color, points))
+            drawn.append(pygame.draw.polygon(screen, (0, 130, 130), points, 2))  # Darker outline
+
+        head_pos = pygame.Vector2(self.render_joints[0].tolist()) - camera.render_offset
+        head_radius = int(self.circle_radii[0])
+        head_rect = pygame.draw.circle(screen, (0, 170, 170), head_pos, head_radius)
+        pygame.draw.circle(screen, (0, 190, 190), head_pos, head_radius - 4)
+
+        eye_offset = pygame.Vector2(head_radius * 0.5, -head_radius * 0.3)
+        eye_pos = head_pos + eye_offset.rotate_rad(float(self.angles[0]))
+        pygame.draw.circle(screen, (255, 255, 255), eye_pos, head_radius * 0.25)
+        pygame.draw.circle(screen, (0, 0, 0), eye_pos, head_radius * 0.15)
+        highlight_pos = eye_pos + pygame.Vector2(-2, -2)
+        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, head_radius * 0.05)
+        return head_rect.unionall(drawn)
+
+    def update(self, mouse_pos):
+        self.step_joints[:] = self.positions
+        joints = self.positions.tolist()
+        length, max_angle = self.length, self.max_angle
+        prev_x, prev_y = float(mouse_pos[0]), float(mouse_pos[1])
+        prev_angle = math.atan2(joints[1][1] - prev_y, joints[1][0] - prev_x)
+        joints[0] = (prev_x, prev_y)
+        angles = [prev_angle]
+        for i in range(1, len(joints)):
+            # Keep the joint `length` away from the previous one...
+            dx, dy = joints[i][0] - prev_x, joints[i][1] - prev_y
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist > 0:
+                dx = prev_x + dx / dist * length - prev_x
+                dy = prev_y + dy / dist * length - prev_y
+            else:
+                dx, dy = 0.0, 0.0
+            # ...and bend at most `max_angle` relative to it
+            angle = math.atan2(dy, dx)
+            angle_diff = angle - prev_angle
+            while angle_diff > math.pi:
+                angle_diff -= 2 * math.pi
+            while angle_diff < -math.pi:
+                angle_diff += 2 * math.pi
+            if angle_diff > max_angle:
+                angle = prev_angle + max_angle
+            elif angle_diff < -max_angle:
+                angle = prev_angle - max_angle
+            prev_x += math.cos(angle) * length
+            prev_y += math.sin(angle) * length
+            joints[i] = (prev_x, prev_y)
+            angles.append(angle)
+            prev_angle = angle
+        self.positions[:] = joints
+        self.angles[:] = angles
+        self._update_bounds()
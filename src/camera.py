@@ -5,10 +5,14 @@ class Camera:
         self.window_size = pygame.Vector2(window_size)
         self.world_size = pygame.Vector2(world_size)
         self.offset = pygame.Vector2(0, 0)
+        # Offset before the last update and the blend used for drawing
+        self.previous_offset = self.offset.copy()
+        self.render_offset = self.offset.copy()
         self.lerp_factor = 0.05  # Adjust as needed for smoothing
         self.threshold = 1.5  # Threshold below which movement will not be applied
 
     def update(self, target_pos):
+        self.previous_offset = self.offset.copy()
         # Calculate the desired camera offset to center the target
         target_offset = pygame.Vector2(
             target_pos.x - self.window_size.x / 2,
@@ -26,5 +30,8 @@ class Camera:
         if abs(target_offset.y - self.offset.y) > self.threshold:
             self.offset.y += (target_offset.y - self.offset.y) * self.lerp_factor
 
+    def interpolate(self, alpha):
+        self.render_offset = self.previous_offset.lerp(self.offset, alpha)
+
     def apply(self, entity):
-        return entity - self.offset
\ No newline at end of file
+        return entity - self.render_offset
\ No newline at end of file
@@ -6,8 +6,12 @@ class Coin:
         self.radius = radius
         self.collected = False
         self.follow_distance = follow_distance  # Closer follow distance
+        # Position before the last update and the blend drawn between them
+        self.previous_position = self.position.copy()
+        self.render_position = self.position.copy()
 
     def update(self, chain):
+        self.previous_position = self.position.copy()
         if not self.collected:
             # Check if any of the joints in the chain are within proximity
             for joint in chain.joints:
@@ -20,6 +24,18 @@ class Coin:
             direction = (self.position - anchor).normalize()
             self.position = anchor + direction * self.follow_distance
 
+    @property
+    def aabb(self):
+        return (self.position.x - self.radius, self.position.y - self.radius,
+                self.position.x + self.radius, self.position.y + self.radius)
+
+    @property
+    def bounding_circle(self):
+        return (self.position.x, self.position.y, self.radius)
+
+    def interpolate(self, alpha):
+        self.render_position = self.previous_position.lerp(self.position, alpha)
+
     def draw(self, screen, camera):
         color = (255, 165, 0)  # Yellow color for the coin
-        pygame.draw.circle(screen, color, camera.apply(self.position), self.radius)
\ No newline at end of file
+        return pygame.draw.circle(screen, color, camera.apply(self.render_position), self.radius)
\ No newline at end of file
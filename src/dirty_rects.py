@@ -0,0 +1,63 @@
+import pygame
+
+class DirtyRectRenderer:
+    """Repaints and presents only the parts of the screen that changed.
+
+    `begin()` clears the rects drawn on the previous frame back to the
+    background. Everything is then drawn as usual, reporting the rects it
+    touched through `mark()`, and `present()` sends only the old and new rects
+    to the display. Outside those rects the screen already holds plain
+    background, so the picture matches a full redraw. When the `view` passed to
+    `begin()` changes (the camera scrolled or the scene switched), or when the
+    renderer is disabled, the whole window is cleared and flipped instead.
+    Screens that only change on input, like the menu, are begun as `static`:
+    they are drawn once and then left alone until their view changes or
+    `invalidate()` is called.
+    """
+
+    def __init__(self, screen, background_color, enabled=True):
+        self.screen = screen
+        self.background_color = background_color
+        self.enabled = enabled
+        self.view = None
+        self.full = True
+        self.idle = False
+        self.previous = []
+        self.current = []
+
+    def begin(self, view, static=False):
+        """Start a frame; returns False when a static view is already on screen,
+        in which case nothing should be drawn and nothing is presented."""
+        self.idle = static and view == self.view
+        if self.idle:
+            return False
+        self.full = not self.enabled or view != self.view
+        self.view = view
+        if self.full:
+            self.screen.fill(self.background_color)
+        else:
+            for rect in self.previous:
+                self.screen.fill(self.background_color, rect)
+        self.current = []
+        return True
+
+    def invalidate(self):
+        """Redraw the whole window on the next frame."""
+        self.view = None
+
+    def mark(self, rect):
+        """Record a screen rect drawn this frame; None is ignored."""
+        if rect is not None:
+            self.current.append(rect.clip(self.screen.get_rect()))
+
+    def mark_all(self):
+        self.current.append(self.screen.get_rect())
+
+    def present(self):
+        if self.idle:
+            return
+        if self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
@@ -0,0 +1,37 @@
+class FixedTimestep:
+    """Accumulator that runs the simulation at a fixed rate, independent of the
+    frame rate.
+
+    Each frame `advance()` adds the frame's wall time and returns how many
+    fixed steps of `dt` seconds to run. If the game falls more than `max_steps`
+    behind, the backlog is dropped instead of spiralling. `alpha` is how far the
+    leftover time reaches into the next step (0..1), which entities use to draw
+    in between their last two simulated states.
+
+    The rate is fixed for the life of the game: velocities, damping and pulls
+    are applied once per step and tuned for 60 steps per second, so a
+    different rate changes how fast everything moves.
+    """
+
+    def __init__(self, rate=60, max_steps=5):
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.rate = rate
+        self.dt = 1.0 / rate
+
+    def reset(self):
+        """Forget accumulated time, e.g. after loading or restarting a level."""
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def advance(self, frame_time):
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= steps * self.dt
+        self.alpha = self.accumulator / self.dt
+        return steps
@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import random
+import numpy as np
+import pygame
+from rope_optimizer import generate_optimized_ropes
+
+# Number of distinct seeded layouts kept per difficulty preset
+LAYOUTS_PER_PRESET = 8
+
+class LayoutCache:
+    """Persistent store of optimized rope layouts.
+
+    Layouts live back to back in a flat little-endian int16 file (x, y, length,
+    points per rope) that is memory-mapped on read. A small JSON index maps each
+    key to its offset, so a lookup is a dict hit plus one slice. When the data
+    file would grow past `max_bytes`, the least recently used layouts are dropped
+    and the file is compacted. `get()` only bumps the LRU clock in memory; the
+    index is written on the next store or `flush()`, which `get_or_create()`
+    calls after a hit.
+    """
+
+    dtype = np.dtype('<i2')
+    # Bump whenever the optimizer's scoring changes so stale layouts are never served
+    version = 2
+
+    def __init__(self, path="rope_layouts", max_bytes=4 * 1024 * 1024,
+                 layouts_per_key=LAYOUTS_PER_PRESET):
+        self.data_path = f"{path}.bin"
+        self.index_path = f"{path}.json"
+        self.max_bytes = max_bytes
+        self.layouts_per_key = layouts_per_key
+        self.entries = {}
+        self.clock = 0
+        self.dirty = False
+        self.load_index()
+
+    def load_index(self):
+        if os.path.exists(self.index_path) and os.path.exists(self.data_path):
+            try:
+                with open(self.index_path, 'r') as f:
+                    index = json.load(f)
+                self.entries = index['entries']
+                self.clock = index['clock']
+            except (OSError, ValueError, KeyError):
+                self.entries, self.clock = {}, 0
+        # An index without its data file (or vice versa) is useless
+        if not self.entries and os.path.exists(self.data_path):
+            os.remove(self.data_path)
+
+    def save_index(self):
+        with open(self.index_path, 'w') as f:
+            json.dump({'entries': self.entries, 'clock': self.clock}, f)
+        self.dirty = False
+
+    def flush(self):
+        """Write the index if lookups have changed the LRU order since the last save."""
+        if self.dirty:
+            self.save_index()
+
+    @staticmethod
+    def make_key(world_size, num_of_ropes, start_area, end_area, seed):
+        start_area, end_area = pygame.Rect(start_area), pygame.Rect(end_area)
+        return "v{}:{}x{}:{}:{},{},{},{}:{},{},{},{}:{}".format(
+            LayoutCache.version, world_size[0], world_size[1], num_of_ropes,
+            *start_area, *end_area, seed)
+
+    def data_size(self):
+        return os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0
+
+    def get(self, world_size, num_of_ropes, start_area, end_area, seed):
+        key = self.make_key(world_size, num_of_ropes, start_area, end_area, seed)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        offset, count = entry[0], entry[1]
+        if offset + count * 4 * self.dtype.itemsize > self.data_size():
+            # The data file was truncated under the index; treat it as a miss
+            del self.entries[key]
+            self.dirty = True
+            return None
+        data = np.memmap(self.data_path, dtype=self.dtype, mode='r',
+                         offset=offset, shape=(count, 4))
+        layout = [tuple(int(v) for v in rope) for rope in data]
+        del data
+
+        self.clock += 1
+        entry[2] = self.clock
+        self.dirty = True
+        return layout
+
+    def put(self, world_size, num_of_ropes, start_area, end_area, seed, layout):
+        key = self.make_key(world_size, num_of_ropes, start_area, end_area, seed)
+        data = np.asarray(layout, dtype=self.dtype).reshape(-1, 4)
+        if data.nbytes > self.max_bytes:
+            return
+        if key in self.entries:
+            del self.entries[key]
+
+        self.evict(self.max_bytes - data.nbytes)
+        offset = self.data_size()
+        with open(self.data_path, 'ab') as f:
+            f.write(data.tobytes())
+        self.clock += 1
+        self.entries[key] = [offset, len(data), self.clock]
+        self.save_index()
+
+    def evict(self, budget):
+        """Drop least recently used layouts until the live data fits in `budget` bytes."""
+        row_bytes = 4 * self.dtype.itemsize
+        live = sum(entry[1] for entry in self.entries.values()) * row_bytes
+        if self.data_size() <= budget:
+            return
+        for key in sorted(self.entries, key=lambda k: self.entries[k][2]):
+            if live <= budget:
+                break
+            live -= self.entries.pop(key)[1] * row_bytes
+        self.compact()
+
+    def compact(self):
+        """Rewrite the data file so it only holds layouts still in the index."""
+        if not os.path.exists(self.data_path):
+            return
+        with open(self.data_path, 'rb') as f:
+            old = f.read()
+        row_bytes = 4 * self.dtype.itemsize
+        chunks = []
+        offset = 0
+        for entry in self.entries.values():
+            size = entry[1] * row_bytes
+            chunks.append(old[entry[0]:entry[0] + size])
+            entry[0] = offset
+            offset += size
+        with open(self.data_path, 'wb') as f:
+            f.write(b''.join(chunks))
+        self.save_index()
+
+    def get_or_create(self, world_size, num_of_ropes, start_area, end_area, seed=None,
+                      on_generation=None):
+        """Fetch a cached layout, optimizing and storing it on a miss.
+
+        With no seed, one of `layouts_per_key` seeded layouts is picked at random.
+        """
+        if seed is None:
+            seed = random.randrange(self.layouts_per_key)
+        layout = self.get(world_size, num_of_ropes, start_area, end_area, seed)
+        if layout is None:
+            layout = generate_optimized_ropes(world_size, num_of_ropes, start_area, end_area, seed=seed,
+                                              on_generation=on_generation)
+            self.put(world_size, num_of_ropes, start_area, end_area, seed, layout)
+        else:
+            # Callers such as generate_level drop the cache after one lookup
+            self.flush()
+        return layout
+
+    def clear(self):
+        self.entries, self.clock = {}, 0
+        self.dirty = False
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+def prefill(cache, world_size, start_area, end_area, workers=None):
+    """Generate and store every seeded layout for each difficulty preset."""
+    from MainMenu import DifficultySettings
+
+    for difficulty, settings in DifficultySettings().difficulties.items():
+        num_of_ropes = settings['num_ropes']
+        for seed in range(cache.layouts_per_key):
+            if cache.get(world_size, num_of_ropes, start_area, end_area, seed) is None:
+                layout = generate_optimized_ropes(world_size, num_of_ropes, start_area, end_area,
+                                                  seed=seed, workers=workers)
+                cache.put(world_size, num_of_ropes, start_area, end_area, seed, layout)
+        print(f"{difficulty}: {cache.layouts_per_key} layouts of {num_of_ropes} ropes")
+    cache.flush()
+
+if __name__ == "__main__":
+    from main import WORLD_SIZE, START_AREA, END_AREA
+
+    parser = argparse.ArgumentParser(description="Pre-fill the rope layout cache for every difficulty preset.")
+    parser.add_argument("--path", default="rope_layouts", help="cache file prefix (default: rope_layouts)")
+    parser.add_argument("--layouts", type=int, default=LAYOUTS_PER_PRESET, help="layouts per preset")
+    parser.add_argument("--max-bytes", type=int, default=4 * 1024 * 1024, help="cache size bound")
+    parser.add_argument("--workers", type=int, default=None, help="use the island optimizer with N workers")
+    parser.add_argument("--clear", action="store_true", help="empty the cache before filling it")
+    args = parser.parse_args()
+
+    cache = LayoutCache(args.path, max_bytes=args.max_bytes, layouts_per_key=args.layouts)
+    if args.clear:
+        cache.clear()
+    prefill(cache, WORLD_SIZE, START_AREA, END_AREA, workers=args.workers)
@@ -0,0 +1,66 @@
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+class LevelPrefetcher:
+    """Builds the next level description in a worker process while the current
+    game runs.
+
+    `generate_level(settings, *args, seed=...)` must be a module-level function
+    returning plain, picklable level data; game objects are built from it in the
+    main process. If the worker pool breaks, levels are generated in-process.
+    The worker is spawned rather than forked, since the game process already
+    runs SDL's threads by the time the prefetcher exists.
+    """
+
+    def __init__(self, generate_level, *args):
+        self.generate_level = generate_level
+        self.args = args
+        self.pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        self.future = None
+        self.settings = None
+
+    def prefetch(self, settings):
+        """Start building a level for `settings` unless one is already on the way."""
+        settings = dict(settings)
+        if self.future is not None and self.settings == settings:
+            return
+        if self.future is not None:
+            self.future.cancel()
+        self.settings = settings
+        seed = random.getrandbits(32)
+        try:
+            self.future = self.pool.submit(self.generate_level, settings, *self.args, seed=seed)
+        except RuntimeError:
+            # Pool is broken or shut down; take() will fall back to in-process generation
+            self.future = None
+
+    def take(self, settings, on_generation=None):
+        """Hand over the prefetched level for `settings` and start on the next one.
+
+        Returns None while the worker is still busy. If there is no usable worker
+        result, the level is generated synchronously, reporting progress through
+        `on_generation`.
+        """
+        self.prefetch(settings)
+        if self.future is not None and not self.future.done():
+            return None
+
+        level = None
+        if self.future is not None:
+            try:
+                level = self.future.result()
+            except Exception:
+                level = None
+        if level is None:
+            level = self.generate_level(dict(settings), *self.args, seed=random.getrandbits(32),
+                                        on_generation=on_generation)
+
+        self.future = None
+        self.prefetch(settings)
+        return level
+
+    def shutdown(self):
+        if self.future is not None:
+            self.future.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
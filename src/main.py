@@ -1,53 +1,255 @@
 import pygame
 import random
 import math
+import time
 from Chain import Chain
+from array_chain import ArrayChain
+from layout_cache import LayoutCache
+from level_prefetcher import LevelPrefetcher
 from rope_optimizer import generate_optimized_ropes
 from SlimeObstacle import SlimeObstacle
+from slime_layer import SlimeLayer
+from slime_pulse import PulseCycle
+from slime_world import SlimeWorld
 from camera import Camera
 from coin import Coin
+from dirty_rects import DirtyRectRenderer
+from fixed_timestep import FixedTimestep
 from smart_blue_tentacle import SmartBlueTentacle
 from smart_verlet_rope import SmartVerletRope
+from rope_world import RopeWorld
 from MainMenu import MainMenu
+from overlay_layers import OverlayLayers
+from minimap import Minimap
+from path_grid import PathGrid
+from placement import SpatialPlacer
+from quality_governor import QualityGovernor
+from sim_lod import SimulationLOD
+from spatial_hash import SpatialHash, box_of_points, grow_box
+from text_cache import render_text
+from view_culling import ViewCuller
+from world_snapshot import WorldSnapshot
 from alert import FuzzyAlert, calculate_distance, calculate_velocity
 
+WORLD_SIZE = (3200, 2400)
+START_AREA = pygame.Rect(1400, 2350, 200, 50)
+END_AREA = pygame.Rect(1500, 0, 100, 50)
+LAYOUT_CACHE_PATH = "rope_layouts"
+SLIME_RADIUS = 30
+SLIME_POINTS = 20
+# Slime radius plus the distance at which a slime catches the chain
+SLIME_BLOCK_RADIUS = 45
+# Personal-space radii used to keep entities apart when placing them
+SLIME_SPACING = 60
+TENTACLE_SPACING = 50
+ROPE_ANCHOR_SPACING = 40
+# Nothing is placed within this distance of the start and end areas
+CORRIDOR_MARGIN = 150
+# Rope layouts tried before ropes are dropped to clear the path
+LAYOUT_ATTEMPTS = 3
+# Joints in the player's chain; long chains use the NumPy-backed ArrayChain
+CHAIN_JOINTS = 5
+ARRAY_CHAIN_MIN_JOINTS = 32
+# Slimes replay an approximate baked pulse loop instead of running the
+# soft-body solver; the loop is baked with the level in the prefetch worker
+BAKE_SLIME_PULSE = False
+# Cell size of the collision broadphase and the largest catch distance:
+# ropes catch at 5, slimes at 15 and tentacles hand back the coin at 25
+COLLISION_CELL_SIZE = 128
+COLLISION_MARGIN = 25
+# Cell size of the view culling grid and how far outside the view an entity
+# already counts as visible
+CULLING_CELL_SIZE = 256
+CULLING_MARGIN = 50
+# Simulation steps per second, independent of the frame rate; the physics is
+# tuned per step, so this must stay at 60
+SIMULATION_RATE = 60
+# Most steps run in one frame to catch up; any further backlog is dropped
+MAX_CATCH_UP_STEPS = 5
+# Repaint only the screen rects that changed while the camera stands still
+DIRTY_RECTS = True
+# Update-and-draw time per frame the quality governor tries to stay under
+FRAME_BUDGET_MS = 14.0
+
 def display_message(screen, message, color, window_size):
-    font = pygame.font.SysFont(None, 55)
-    text = font.render(message, True, color)
+    text = render_text(message, 55, color)
     text_rect = text.get_rect(center=(window_size[0] / 2, window_size[1] / 2))
-    screen.blit(text, text_rect)
+    return screen.blit(text, text_rect)
 
-def generate_world_content(num_slimes):
-    return [SlimeObstacle((random.randint(100, 3100), random.randint(100, 2300)), 30, 20) 
-            for _ in range(num_slimes)]
+def draw_loading_screen(screen, window_size, message="Generating level..."):
+    screen.fill((255, 255, 255))
+    display_message(screen, message, (0, 0, 0), window_size)
 
-def generate_ropes(world_size, num_of_ropes, start_area, end_area):
-    optimized_rope_config = generate_optimized_ropes(world_size, num_of_ropes, start_area, end_area)
-    return [SmartVerletRope((x, y), points, length) 
-            for (x, y, length, points) in optimized_rope_config]
+def generate_world_content(num_slimes, placer, path_grid=None, attempts=20):
+    slime_positions = []
+    for _ in range(num_slimes):
+        for _ in range(attempts):
+            position = placer.sample(SLIME_SPACING)
+            if position is None:
+                break
+            if path_grid is None:
+                break
+            # Keep the slime only if the end area is still reachable around it
+            path_grid.add_disc(*position, SLIME_BLOCK_RADIUS)
+            if path_grid.is_clear():
+                break
+            path_grid.remove_disc(*position, SLIME_BLOCK_RADIUS)
+            position = None
+        if position is None:
+            continue
+        placer.add(position, SLIME_SPACING)
+        slime_positions.append(position)
+    return slime_positions
 
-def generate_blue_tentacles(world_size, num_of_tentacles):
-    return [SmartBlueTentacle((random.randint(100, 3100), random.randint(100, 2300)), 
-            points=5, segment_length=40) for _ in range(num_of_tentacles)]
+def generate_ropes(world_size, num_of_ropes, start_area, end_area, layout_cache=None, rng=random,
+                   on_generation=None):
+    if layout_cache is not None:
+        return layout_cache.get_or_create(world_size, num_of_ropes, start_area, end_area,
+                                          seed=rng.randrange(layout_cache.layouts_per_key),
+                                          on_generation=on_generation)
+    return generate_optimized_ropes(world_size, num_of_ropes, start_area, end_area,
+                                    seed=rng.getrandbits(32), on_generation=on_generation)
 
-def initialize_game(difficulty_settings, window_size, world_size, start_area, end_area):
-    num_of_ropes = difficulty_settings['num_ropes']
-    num_of_slimes = difficulty_settings['num_slimes']
-    num_of_blue_tentacles = difficulty_settings['num_tentacles']
-    
-    slimes = generate_world_content(num_of_slimes)
+def generate_blue_tentacles(num_of_tentacles, placer):
+    return placer.place(num_of_tentacles, TENTACLE_SPACING)
+
+def generate_level(difficulty_settings, world_size, start_area, end_area, layout_cache_path=None,
+                   seed=None, on_generation=None):
+    """Describe a level as plain data so it can be generated in another process."""
+    rng = random.Random(seed)
+    layout_cache = LayoutCache(layout_cache_path) if layout_cache_path else None
+
+    for attempt in range(LAYOUT_ATTEMPTS):
+        # Re-rolls skip the cache, which could hand back the same blocked layout
+        rope_config = generate_ropes(world_size, difficulty_settings['num_ropes'], start_area, end_area,
+                                     layout_cache if attempt == 0 else None, rng, on_generation)
+        path_grid = PathGrid(world_size, start_area, end_area)
+        for (x, y, length, points) in rope_config:
+            path_grid.add_disc(x, y, length * points)
+        if path_grid.is_clear():
+            break
+    else:
+        # Still blocked: drop ropes until the end area can be reached again
+        while not path_grid.is_clear():
+            x, y, length, points = rope_config.pop()
+            path_grid.remove_disc(x, y, length * points)
+
+    corridors = [pygame.Rect(area).inflate(2 * CORRIDOR_MARGIN, 2 * CORRIDOR_MARGIN)
+                 for area in (start_area, end_area)]
+    placer = SpatialPlacer(world_size, keep_out=corridors, rng=rng)
+    for (x, y, length, points) in rope_config:
+        placer.add((x, y), ROPE_ANCHOR_SPACING)
+    slime_positions = generate_world_content(difficulty_settings['num_slimes'], placer, path_grid)
+    tentacle_anchors = generate_blue_tentacles(difficulty_settings['num_tentacles'], placer)
+    slime_pulse = (PulseCycle.get(SLIME_RADIUS, SLIME_POINTS, SlimeObstacle.PULSE_STRENGTH)
+                   if BAKE_SLIME_PULSE else None)
+
+    return {'ropes': rope_config, 'slimes': slime_positions, 'tentacles': tentacle_anchors,
+            'slime_pulse': slime_pulse}
+
+def build_level(level):
+    if level.get('slime_pulse') is not None:
+        PulseCycle.share(level['slime_pulse'])
+    slime_world = SlimeWorld(capacity=max(1, len(level['slimes'])))
+    slimes = [SlimeObstacle(position, SLIME_RADIUS, SLIME_POINTS, world=slime_world, baked=BAKE_SLIME_PULSE)
+              for position in level['slimes']]
     chain_start_pos = (1600, 2300)
-    chain = Chain(chain_start_pos, 5, 20, math.pi / 4)
-    ropes = generate_ropes(world_size, num_of_ropes, start_area, end_area)
-    blue_tentacles = generate_blue_tentacles(world_size, num_of_blue_tentacles)
+    chain_class = ArrayChain if CHAIN_JOINTS >= ARRAY_CHAIN_MIN_JOINTS else Chain
+    chain = chain_class(chain_start_pos, CHAIN_JOINTS, 20, math.pi / 4)
+    rope_world = RopeWorld(capacity=max(1, len(level['ropes'])))
+    ropes = [SmartVerletRope((x, y), points, length, world=rope_world)
+             for (x, y, length, points) in level['ropes']]
+    blue_tentacles = [SmartBlueTentacle(anchor, points=5, segment_length=40)
+                      for anchor in level['tentacles']]
     coin = Coin((1650, 2300), follow_distance=20)
-    
+
     return slimes, chain, ropes, blue_tentacles, coin
 
+def update_collision_hash(collision_hash, slimes, ropes, blue_tentacles):
+    """Re-bucket every rope, slime ring and tentacle head by its cached bounding box."""
+    for rope in ropes:
+        collision_hash.update(rope, rope.aabb)
+    for slime in slimes:
+        collision_hash.update(slime, slime.aabb)
+    for tentacle in blue_tentacles:
+        head = tentacle.points[0]
+        collision_hash.update(tentacle, (head.x, head.y, head.x, head.y))
+
+def update_view_culler(view_culler, ropes, blue_tentacles):
+    """Re-bucket every rope and tentacle by the box it is drawn in."""
+    for rope in ropes:
+        view_culler.update(rope, rope.aabb)
+    for tentacle in blue_tentacles:
+        box = tentacle.aabb
+        if not tentacle.is_active:
+            # Inactive tentacles also show at their anchor
+            box = box_of_points((box[:2], box[2:], tentacle.anchor_pos))
+        view_culler.update(tentacle, box)
+
+def step_simulation(dt, camera, slimes, chain, ropes, blue_tentacles, coin, end_area, collision_hash):
+    """Advance the game by one fixed step of `dt` seconds; returns (game_over, game_won)."""
+    game_over = False
+    game_won = False
+    camera.update(pygame.Vector2(chain.joints[0]))
+    mouse_world_pos = pygame.Vector2(pygame.mouse.get_pos()) + camera.offset
+    chain.update(mouse_world_pos)
+    chain_end = pygame.Vector2(chain.joints[-1])
+    coin.update(chain)
+
+    # Update game objects; ropes and slimes only queue their physics in
+    # update() and are solved in one batch per world
+    for rope in ropes:
+        rope.update(mouse_world_pos, chain_end, dt)
+    for rope_world in {rope.world for rope in ropes}:
+        rope_world.step()
+    for slime in slimes:
+        slime.update(dt)
+    for slime_world in {slime.world for slime in slimes}:
+        slime_world.step()
+    for tentacle in blue_tentacles:
+        tentacle.update(chain, coin, dt)
+
+    # Broadphase: only entities sharing a hash cell with the chain (grown by
+    # the largest catch distance) get the exact checks
+    update_collision_hash(collision_hash, slimes, ropes, blue_tentacles)
+    nearby = collision_hash.query(grow_box(chain.aabb, COLLISION_MARGIN))
+
+    for rope in ropes:
+        if rope in nearby and rope.check_collision_with_chain(chain):
+            game_over = True
+    for slime in slimes:
+        if slime in nearby and slime.check_collision(chain):
+            game_over = True
+    for tentacle in blue_tentacles:
+        if tentacle in nearby and tentacle.has_coin and tentacle.points[0].distance_to(chain.joints[0]) < 25:
+            coin.collected = True
+            tentacle.has_coin = False
+
+    if end_area.collidepoint(chain_end):
+        game_won = True
+
+    chain.smooth_joints()
+    return game_over, game_won
+
+def interpolate_level(alpha, camera, slimes, chain, ropes, blue_tentacles, coin):
+    """Place everything `alpha` of the way from its previous to its current step for drawing."""
+    camera.interpolate(alpha)
+    chain.interpolate(alpha)
+    coin.interpolate(alpha)
+    for rope_world in {rope.world for rope in ropes}:
+        rope_world.interpolate(alpha)
+    for slime_world in {slime.world for slime in slimes}:
+        slime_world.interpolate(alpha)
+    for tentacle in blue_tentacles:
+        tentacle.interpolate(alpha)
+
+def initialize_game(difficulty_settings, window_size, world_size, start_area, end_area, layout_cache_path=None):
+    return build_level(generate_level(difficulty_settings, world_size, start_area, end_area, layout_cache_path))
+
 def main():
     pygame.init()
     window_size = (800, 600)
-    world_size = (3200, 2400)
+    world_size = WORLD_SIZE
     screen = pygame.display.set_mode(window_size)
     pygame.display.set_caption("Slime Run")
     
@@ -55,16 +257,27 @@ def main():
     background_color = (255, 255, 255)
     start_area_color = (0, 255, 0)
     end_area_color = (0, 0, 255)
-    start_area = pygame.Rect(1400, 2350, 200, 50)
-    end_area = pygame.Rect(1500, 0, 100, 50)
+    start_area = START_AREA
+    end_area = END_AREA
     
     # Initialize game components
     clock = pygame.time.Clock()
+    timestep = FixedTimestep(SIMULATION_RATE, MAX_CATCH_UP_STEPS)
+    sim_lod = SimulationLOD()
+    quality_governor = QualityGovernor(sim_lod, FRAME_BUDGET_MS)
+    collision_hash = SpatialHash(world_size, COLLISION_CELL_SIZE)
     camera = Camera(window_size, world_size)
+    slime_layer = SlimeLayer(window_size)
+    overlay_layers = OverlayLayers(window_size)
+    renderer = DirtyRectRenderer(screen, background_color, DIRTY_RECTS)
+    minimap = Minimap(world_size, window_size, background_color,
+                      [(start_area, start_area_color), (end_area, end_area_color)])
+    view_culler = ViewCuller(camera, world_size, CULLING_CELL_SIZE, CULLING_MARGIN)
     main_menu = MainMenu(window_size)
+    level_prefetcher = LevelPrefetcher(generate_level, world_size, start_area, end_area, LAYOUT_CACHE_PATH)
 
     # Initialize Fuzzy Alert System
-    alert_system = FuzzyAlert()
+    alert_system = FuzzyAlert(overlay_layers)
     
     # Initialize game states
     running = True
@@ -73,24 +286,34 @@ def main():
     game_started = False
     show_full_map = False
     in_main_menu = True
+    loading_level = False
+    
+    world_snapshot = None
     
     # Create UI buttons
-    restart_button = pygame.Rect(window_size[0] // 4, window_size[1] // 2 + 50, 150, 50)
-    menu_button = pygame.Rect(window_size[0] * 3 // 4 - 150, window_size[1] // 2 + 50, 150, 50)
+    restart_button = pygame.Rect(window_size[0] // 2 - 250, window_size[1] // 2 + 50, 150, 50)
+    new_level_button = pygame.Rect(window_size[0] // 2 - 75, window_size[1] // 2 + 50, 150, 50)
+    menu_button = pygame.Rect(window_size[0] // 2 + 100, window_size[1] // 2 + 50, 150, 50)
     
-    # Initialize game objects with default settings
+    # Start building a level for the default settings while the menu is shown
     current_settings = main_menu.difficulty_settings.get_settings()
-    slimes, chain, ropes, blue_tentacles, coin = initialize_game(
-        current_settings, window_size, world_size, start_area, end_area
-    )
+    level_prefetcher.prefetch(current_settings)
+
+    def show_generation_progress(generation, best_score, mean_score):
+        pygame.event.pump()
+        draw_loading_screen(screen, window_size, f"Generating level... ({generation})")
+        pygame.display.flip()
 
     while running:
-        delta_time = clock.get_time() / 1000.0
-        screen.fill(background_color)
+        frame_time = clock.get_time() / 1000.0
+        frame_start = time.perf_counter()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if in_main_menu or loading_level or show_full_map or game_over or game_won:
+                # Static screens are only redrawn once input may have changed them
+                renderer.invalidate()
                 
             if in_main_menu:
                 action, settings = main_menu.handle_event(event)
@@ -100,10 +323,10 @@ def main():
                     game_over = False
                     game_won = False
                     current_settings = settings
-                    slimes, chain, ropes, blue_tentacles, coin = initialize_game(
-                        current_settings, window_size, world_size, start_area, end_area
-                    )
-            else:
+                    loading_level = True
+                elif action == 'DIFFICULTY_CHANGE':
+                    level_prefetcher.prefetch(main_menu.difficulty_settings.get_settings())
+            elif not loading_level:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_m:
                         show_full_map = not show_full_map
@@ -112,13 +335,19 @@ def main():
                     mouse_pos = pygame.mouse.get_pos()
                     if game_over or game_won:
                         if restart_button.collidepoint(mouse_pos):
+                            # Same level: rebuild the initial world from the snapshot
                             game_over = False
                             game_won = False
                             game_started = False
-                            SmartVerletRope.clear_cache()
-                            slimes, chain, ropes, blue_tentacles, coin = initialize_game(
-                                current_settings, window_size, world_size, start_area, end_area
-                            )
+                            slimes, chain, ropes, blue_tentacles, coin = world_snapshot.restore()
+                            timestep.reset()
+                            collision_hash.clear()
+                            view_culler.clear()
+                        elif new_level_button.collidepoint(mouse_pos):
+                            game_over = False
+                            game_won = False
+                            game_started = False
+                            loading_level = True
                         elif menu_button.collidepoint(mouse_pos):
                             in_main_menu = True
                     elif not game_started:
@@ -126,71 +355,60 @@ def main():
                         if start_area.collidepoint(mouse_world_pos):
                             game_started = True
 
+        if not in_main_menu and loading_level:
+            # Hand over the prefetched level, or keep showing progress until it arrives
+            level = level_prefetcher.take(current_settings, on_generation=show_generation_progress)
+            if level is not None:
+                SmartVerletRope.clear_cache()
+                slimes, chain, ropes, blue_tentacles, coin = build_level(level)
+                world_snapshot = WorldSnapshot.capture(slimes, chain, ropes, blue_tentacles, coin)
+                timestep.reset()
+                collision_hash.clear()
+                view_culler.clear()
+                loading_level = False
+
         if in_main_menu:
-            main_menu.draw(screen)
+            if renderer.begin('menu', static=True):
+                main_menu.draw(screen)
+        elif loading_level:
+            if renderer.begin('loading', static=True):
+                draw_loading_screen(screen, window_size)
         else:
-            # Update visibility of game objects
+            # Update visibility of game objects from the culling grid
+            update_view_culler(view_culler, ropes, blue_tentacles)
+            visible = view_culler.visible()
             for tentacle in blue_tentacles:
-                tentacle.is_visible = tentacle.is_in_view(camera, window_size)
+                tentacle.is_visible = tentacle in visible
             for rope in ropes:
-                rope.is_visible = rope.is_in_view(camera, window_size)
+                rope.is_visible = rope in visible
+            # Pick each entity's simulation detail from its distance to the view
+            view = pygame.Rect(int(camera.offset.x), int(camera.offset.y), *window_size)
+            sim_lod.update('ropes', ropes, view)
+            sim_lod.update('tentacles', blue_tentacles, view)
+            sim_lod.update('slimes', slimes, view)
 
             if show_full_map:
-                # Draw full map view
-                game_surface = pygame.Surface(world_size)
-                game_surface.fill(background_color)
-                for rope in ropes:
-                    rope.draw(game_surface, camera)
-                chain.draw(game_surface, camera)
-                for slime in slimes:
-                    slime.draw(game_surface, camera)
-                for tentacle in blue_tentacles:
-                    tentacle.draw(game_surface, camera)
-                coin.draw(game_surface, camera)
-                pygame.draw.rect(game_surface, start_area_color, start_area)
-                pygame.draw.rect(game_surface, end_area_color, end_area)
-                scaled_surface = pygame.transform.scale(game_surface, window_size)
-                screen.blit(scaled_surface, (0, 0))
-                display_message(screen, "Full Map View: Press M to Toggle", (0, 0, 0), window_size)
+                # Draw full map view; nothing moves while it is shown
+                if renderer.begin('map', static=True):
+                    minimap.draw(screen, slimes, chain, ropes, blue_tentacles, coin)
+                    display_message(screen, "Full Map View: Press M to Toggle", (0, 0, 0), window_size)
             else:
                 if not game_started:
-                    # Draw start screen
-                    camera.update(pygame.Vector2(chain.joints[0]))
-                    transformed_start_area = pygame.Rect(
-                        camera.apply(pygame.Vector2(start_area.topleft)),
-                        start_area.size
-                    )
-                    pygame.draw.rect(screen, start_area_color, transformed_start_area)
-                    display_message(screen, "Click to Start!", (0, 0, 0), window_size)
+                    # Only the camera moves until the player clicks the start area
+                    for _ in range(timestep.advance(frame_time)):
+                        camera.update(pygame.Vector2(chain.joints[0]))
+                    camera.interpolate(timestep.alpha)
                 elif not game_over and not game_won:
-                    # Update game state
-                    camera.update(pygame.Vector2(chain.joints[0]))
-                    mouse_world_pos = pygame.Vector2(pygame.mouse.get_pos()) + camera.offset
-                    chain.update(mouse_world_pos)
-                    chain_end = chain.joints[-1]
-                    coin.update(chain)
-                    
-                    # Update game objects and check collisions
-                    for rope in ropes:
-                        rope.update(mouse_world_pos, chain_end)
-                        if rope.check_collision_with_chain(chain):
-                            game_over = True
-                            
-                    for slime in slimes:
-                        slime.update(delta_time)
-                        if slime.check_collision(chain):
-                            game_over = True
-                            
-                    for tentacle in blue_tentacles:
-                        tentacle.update(chain, coin)
-                        if tentacle.has_coin and tentacle.points[0].distance_to(chain.joints[0]) < 25:
-                            coin.collected = True
-                            tentacle.has_coin = False
-                            
-                    if end_area.collidepoint(chain_end):
-                        game_won = True
+                    # Run as many fixed steps as this frame's time covers
+                    for _ in range(timestep.advance(frame_time)):
+                        game_over, game_won = step_simulation(timestep.dt, camera, slimes, chain, ropes,
+                                                              blue_tentacles, coin, end_area, collision_hash)
+                        if game_over or game_won:
+                            break
+                    # Draw in between the last two steps; a finished game shows its final step
+                    alpha = 1.0 if game_over or game_won else timestep.alpha
+                    interpolate_level(alpha, camera, slimes, chain, ropes, blue_tentacles, coin)
 
-                    
                     # Update alert system
                     threats = []
 
@@ -226,73 +444,95 @@ def main():
                     alert_system.update_danger_level(threats)
                     alert_system.create_overlay(window_size)
 
-                # Draw game objects
-                chain.draw(screen, camera)
-                for rope in ropes:
-                    rope.draw(screen, camera)
-                for slime in slimes:
-                    slime.draw(screen, camera)
-                for tentacle in blue_tentacles:
-                    tentacle.draw(screen, camera)
-                coin.draw(screen, camera)
+                # Everything moves on screen when the camera does; the end
+                # screens are drawn once and kept until input arrives
+                scene = (game_started, game_over, game_won, tuple(camera.render_offset))
+                if renderer.begin(scene, static=game_over or game_won):
+                    if not game_started:
+                        # Draw start screen
+                        transformed_start_area = pygame.Rect(
+                            camera.apply(pygame.Vector2(start_area.topleft)),
+                            start_area.size
+                        )
+                        renderer.mark(pygame.draw.rect(screen, start_area_color, transformed_start_area))
+                        renderer.mark(display_message(screen, "Click to Start!", (0, 0, 0), window_size))
+
+                    # Draw game objects
+                    renderer.mark(chain.draw(screen, camera))
+                    for rope in ropes:
+                        renderer.mark(rope.draw(screen, camera))
+                    renderer.mark(slime_layer.draw(screen, camera, slimes))
+                    for tentacle in blue_tentacles:
+                        renderer.mark(tentacle.draw(screen, camera))
+                    renderer.mark(coin.draw(screen, camera))
                 
-                # Draw end area
-                transformed_end_area = pygame.Rect(
-                    camera.apply(pygame.Vector2(end_area.topleft)),
-                    end_area.size
-                )
-                pygame.draw.rect(screen, end_area_color, transformed_end_area)
-
-                # Draw alert overlay
-                if not game_over and not game_won and game_started:
-                    alert_system.draw(screen)
-
-                # Handle game over state
-                if game_over:
-                    overlay = pygame.Surface(window_size, pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 128))
-                    screen.blit(overlay, (0, 0))
-                    display_message(screen, "Game Over!", (255, 0, 0), 
-                                 (window_size[0], window_size[1] - 100))
+                    # Draw end area
+                    transformed_end_area = pygame.Rect(
+                        camera.apply(pygame.Vector2(end_area.topleft)),
+                        end_area.size
+                    )
+                    renderer.mark(pygame.draw.rect(screen, end_area_color, transformed_end_area))
+
+                    # Draw alert overlay
+                    if not game_over and not game_won and game_started:
+                        renderer.mark(alert_system.draw(screen))
+
+                    # Handle game over state
+                    if game_over:
+                        overlay_layers.draw(screen, (0, 0, 0), 128)
+                        display_message(screen, "Game Over!", (255, 0, 0), 
+                                     (window_size[0], window_size[1] - 100))
+                    
+                        # Draw UI buttons
+                        pygame.draw.rect(screen, (200, 200, 200), restart_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), restart_button, 2, border_radius=10)
+                        restart_text = render_text("Restart", 36, (0, 0, 0))
+                        restart_text_rect = restart_text.get_rect(center=restart_button.center)
+                        screen.blit(restart_text, restart_text_rect)
                     
-                    # Draw UI buttons
-                    pygame.draw.rect(screen, (200, 200, 200), restart_button, border_radius=10)
-                    pygame.draw.rect(screen, (0, 0, 0), restart_button, 2, border_radius=10)
-                    font = pygame.font.SysFont(None, 36)
-                    restart_text = font.render("Restart", True, (0, 0, 0))
-                    restart_text_rect = restart_text.get_rect(center=restart_button.center)
-                    screen.blit(restart_text, restart_text_rect)
+                        pygame.draw.rect(screen, (200, 200, 200), new_level_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), new_level_button, 2, border_radius=10)
+                        new_level_text = render_text("New Level", 36, (0, 0, 0))
+                        new_level_text_rect = new_level_text.get_rect(center=new_level_button.center)
+                        screen.blit(new_level_text, new_level_text_rect)
                     
-                    pygame.draw.rect(screen, (200, 200, 200), menu_button, border_radius=10)
-                    pygame.draw.rect(screen, (0, 0, 0), menu_button, 2, border_radius=10)
-                    menu_text = font.render("Main Menu", True, (0, 0, 0))
-                    menu_text_rect = menu_text.get_rect(center=menu_button.center)
-                    screen.blit(menu_text, menu_text_rect)
+                        pygame.draw.rect(screen, (200, 200, 200), menu_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), menu_button, 2, border_radius=10)
+                        menu_text = render_text("Main Menu", 36, (0, 0, 0))
+                        menu_text_rect = menu_text.get_rect(center=menu_button.center)
+                        screen.blit(menu_text, menu_text_rect)
                     
-                elif game_won:
-                    overlay = pygame.Surface(window_size, pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 128))
-                    screen.blit(overlay, (0, 0))
-                    display_message(screen, "Victory!", (0, 255, 0), 
-                                 (window_size[0], window_size[1] - 100))
+                    elif game_won:
+                        overlay_layers.draw(screen, (0, 0, 0), 128)
+                        display_message(screen, "Victory!", (0, 255, 0), 
+                                     (window_size[0], window_size[1] - 100))
                     
-                    # Draw UI buttons
-                    pygame.draw.rect(screen, (200, 200, 200), restart_button, border_radius=10)
-                    pygame.draw.rect(screen, (0, 0, 0), restart_button, 2, border_radius=10)
-                    font = pygame.font.SysFont(None, 36)
-                    restart_text = font.render("Play Again", True, (0, 0, 0))
-                    restart_text_rect = restart_text.get_rect(center=restart_button.center)
-                    screen.blit(restart_text, restart_text_rect)
+                        # Draw UI buttons
+                        pygame.draw.rect(screen, (200, 200, 200), restart_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), restart_button, 2, border_radius=10)
+                        restart_text = render_text("Play Again", 36, (0, 0, 0))
+                        restart_text_rect = restart_text.get_rect(center=restart_button.center)
+                        screen.blit(restart_text, restart_text_rect)
                     
-                    pygame.draw.rect(screen, (200, 200, 200), menu_button, border_radius=10)
-                    pygame.draw.rect(screen, (0, 0, 0), menu_button, 2, border_radius=10)
-                    menu_text = font.render("Main Menu", True, (0, 0, 0))
-                    menu_text_rect = menu_text.get_rect(center=menu_button.center)
-                    screen.blit(menu_text, menu_text_rect)
+                        pygame.draw.rect(screen, (200, 200, 200), new_level_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), new_level_button, 2, border_radius=10)
+                        new_level_text = render_text("New Level", 36, (0, 0, 0))
+                        new_level_text_rect = new_level_text.get_rect(center=new_level_button.center)
+                        screen.blit(new_level_text, new_level_text_rect)
+                    
+                        pygame.draw.rect(screen, (200, 200, 200), menu_button, border_radius=10)
+                        pygame.draw.rect(screen, (0, 0, 0), menu_button, 2, border_radius=10)
+                        menu_text = render_text("Main Menu", 36, (0, 0, 0))
+                        menu_text_rect = menu_text.get_rect(center=menu_button.center)
+                        screen.blit(menu_text, menu_text_rect)
 
-        pygame.display.flip()
+        renderer.present()
+        if not in_main_menu and not loading_level:
+            # Render and simulation detail follow the work done this frame
+            quality_governor.update((time.perf_counter() - frame_start) * 1000)
         clock.tick(60)
 
+    level_prefetcher.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import pygame
+
+class Minimap:
+    """Scaled-down view of the whole world for the full-map mode.
+
+    The background and the start and end areas never move, so they are drawn
+    once into `static`. Each frame the rects the entities covered on the last
+    frame are restored from it and the entities are drawn again as simple
+    shapes at map scale, so only the parts of the map that changed are touched
+    and nothing is ever drawn at world size.
+    """
+
+    def __init__(self, world_size, size, background_color, areas):
+        self.size = size
+        self.scale = (size[0] / world_size[0], size[1] / world_size[1])
+        self.static = pygame.Surface(size)
+        self.static.fill(background_color)
+        for rect, color in areas:
+            pygame.draw.rect(self.static, color, self.to_map_rect(rect))
+        self.surface = self.static.copy()
+        self.dirty = []
+
+    def to_map(self, point):
+        return (point[0] * self.scale[0], point[1] * self.scale[1])
+
+    def to_map_rect(self, rect):
+        left, top = self.to_map(rect.topleft)
+        right, bottom = self.to_map(rect.bottomright)
+        return pygame.Rect(round(left), round(top), max(1, round(right - left)), max(1, round(bottom - top)))
+
+    def length(self, world_length, minimum=1):
+        """A world-space length (line width, radius) at map scale."""
+        return max(minimum, round(world_length * self.scale[0]))
+
+    def draw(self, screen, slimes, chain, ropes, blue_tentacles, coin):
+        for rect in self.dirty:
+            self.surface.blit(self.static, rect, rect)
+        self.dirty = []
+
+        for rope in ropes:
+            self._draw_rope(rope)
+        self._draw_chain(chain)
+        for slime in slimes:
+            points = [self.to_map(point) for point in slime.render_points]
+            self.dirty.append(pygame.draw.polygon(self.surface, (0, 0, 0), points))
+        for tentacle in blue_tentacles:
+            self._draw_tentacle(tentacle)
+        self.dirty.append(pygame.draw.circle(self.surface, (255, 165, 0), self.to_map(coin.render_position),
+                                             self.length(coin.radius, 2)))
+        screen.blit(self.surface, (0, 0))
+
+    def _draw_rope(self, rope):
+        color = rope.visuals['base_color']
+        if not rope.is_active:
+            self.dirty.append(pygame.draw.circle(self.surface, color, self.to_map(rope.anchor_pos), self.length(10)))
+            return
+        points = [self.to_map(point) for point in rope.render_points]
+        self.dirty.append(pygame.draw.lines(self.surface, color, False, points,
+                                            self.length(rope.visuals['thickness'][0])))
+
+    def _draw_chain(self, chain):
+        points = [self.to_map(joint) for joint in chain.render_joints]
+        self.dirty.append(pygame.draw.lines(self.surface, (0, 150, 150), False, points,
+                                            self.length(chain.circle_radii[-1] * 2)))
+        self.dirty.append(pygame.draw.circle(self.surface, (0, 170, 170), points[0],
+                                             self.length(chain.circle_radii[0])))
+
+    def _draw_tentacle(self, tentacle):
+        if not tentacle.is_active:
+            self.dirty.append(pygame.draw.circle(self.surface, (0, 0, 255), self.to_map(tentacle.anchor_pos),
+                                                 self.length(10)))
+            return
+        points = [self.to_map(point) for point in tentacle.render_points]
+        self.dirty.append(pygame.draw.lines(self.surface, (0, 0, 255), False, points, self.length(5)))
+        if tentacle.has_coin:
+            self.dirty.append(pygame.draw.circle(self.surface, (255, 165, 0), points[0], self.length(8, 2)))
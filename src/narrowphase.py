@@ -0,0 +1,42 @@
+import numpy as np
+
+def _first_hit(hits):
+    """(row, column) of the first True in row-major order, or None."""
+    index = int(np.argmax(hits))
+    if not hits.flat[index]:
+        return None
+    return divmod(index, hits.shape[1])
+
+def point_distances(points, targets):
+    """(len(points), len(targets)) distances between two (n, 2) point arrays."""
+    delta = np.asarray(targets)[None] - np.asarray(points)[:, None]
+    return np.sqrt(delta[..., 0] * delta[..., 0] + delta[..., 1] * delta[..., 1])
+
+def segment_distances(points, starts, ends):
+    """(len(points), len(segments)) distances from each point to each segment.
+
+    Zero-length segments measure the distance to their start point.
+    """
+    points = np.asarray(points)[:, None]
+    starts = np.asarray(starts)[None]
+    line = np.asarray(ends)[None] - starts
+    offset = points - starts
+    line_length = np.sqrt(line[..., 0] * line[..., 0] + line[..., 1] * line[..., 1])
+    length_sq = line_length * line_length
+    dot = offset[..., 0] * line[..., 0] + offset[..., 1] * line[..., 1]
+    t = np.clip(np.divide(dot, length_sq, out=np.zeros_like(dot), where=length_sq > 0), 0, 1)
+    gap = offset - line * t[..., None]
+    return np.sqrt(gap[..., 0] * gap[..., 0] + gap[..., 1] * gap[..., 1])
+
+def first_point_hit(points, targets, radius):
+    """First (point, target) pair closer than `radius`, scanning points then
+    targets in order, or None if nothing is that close."""
+    if len(points) == 0 or len(targets) == 0:
+        return None
+    return _first_hit(point_distances(points, targets) < radius)
+
+def first_segment_hit(points, starts, ends, radius):
+    """First (point, segment) pair closer than `radius`, or None."""
+    if len(points) == 0 or len(starts) == 0:
+        return None
+    return _first_hit(segment_distances(points, starts, ends) < radius)
@@ -0,0 +1,39 @@
+import pygame
+
+class OverlayLayers:
+    """Persistent full-window tint layers for dimming and alert overlays.
+
+    A layer is one plain surface of a single color with a surface-wide alpha,
+    filled once and kept per (color, alpha). Alphas are rounded to multiples
+    of `alpha_step`, so a fading overlay reuses a handful of layers instead of
+    refilling a surface every frame. Fully transparent overlays are not
+    blitted at all.
+    """
+
+    def __init__(self, size, alpha_step=8):
+        self.size = tuple(size)
+        self.alpha_step = alpha_step
+        self.layers = {}
+
+    def quantize(self, alpha):
+        return min(255, max(0, round(alpha / self.alpha_step) * self.alpha_step))
+
+    def layer(self, color, alpha):
+        """The cached layer for a color and alpha, or None when it would be invisible."""
+        alpha = self.quantize(alpha)
+        if alpha == 0:
+            return None
+        key = (tuple(color), alpha)
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.layers[key] = pygame.Surface(self.size)
+            layer.fill(color)
+            layer.set_alpha(alpha)
+        return layer
+
+    def draw(self, screen, color, alpha):
+        """Tint the whole screen; returns the rect drawn, or None if nothing was."""
+        layer = self.layer(color, alpha)
+        if layer is None:
+            return None
+        return screen.blit(layer, (0, 0))
@@ -0,0 +1,160 @@
+import math
+import numpy as np
+import pygame
+
+# Bit masks with the lowest k bits set, indexed by k (0..64)
+_PREFIX_MASKS = np.array([(1 << k) - 1 for k in range(65)], dtype=np.uint64)
+_ONE = np.uint64(1)
+
+def _fill_columns(reach, free):
+    """Spread a (rows, layouts) reach mask any distance up and down through free
+    cells, doubling the shift each round."""
+    filled = reach.copy()
+    for down in (True, False):
+        spread, open_run = reach.copy(), free.copy()
+        shift = 1
+        while shift < len(reach):
+            # open_run marks cells that end a run of `shift` free cells
+            if down:
+                spread[shift:] |= open_run[shift:] & spread[:-shift]
+                open_run[shift:] &= open_run[:-shift]
+                open_run[:shift] = 0
+            else:
+                spread[:-shift] |= open_run[:-shift] & spread[shift:]
+                open_run[:-shift] &= open_run[shift:]
+                open_run[-shift:] = 0
+            shift *= 2
+        filled |= spread
+    return filled
+
+class PathGrid:
+    """Coarse occupancy grid of the world used to check that the end area can be
+    reached from the start area.
+
+    Each grid row is packed into one uint64 bit mask (bit i = column i), so the
+    world is split into at most 64 columns. Blocking discs are tracked as per-cell
+    coverage counts, which lets a single disc be added or removed without
+    rebuilding the grid. Reachability is a flood fill over the packed rows that
+    spreads one cell in every direction per step, with a jump straight along the
+    columns every few steps.
+    """
+
+    def __init__(self, world_size, start_area, end_area, cell_size=50):
+        self.world_size = world_size
+        self.cell_size = max(cell_size, math.ceil(world_size[0] / 64))
+        self.cols = math.ceil(world_size[0] / self.cell_size)
+        self.rows = math.ceil(world_size[1] / self.cell_size)
+        self.col_mask = _PREFIX_MASKS[self.cols]
+        self.coverage = np.zeros((self.rows, self.cols), dtype=np.int16)
+        self.start_rows = self.rect_rows(start_area)
+        self.end_rows = self.rect_rows(end_area)
+
+    def rect_rows(self, rect):
+        """Row masks of every cell a rect touches."""
+        rect = pygame.Rect(rect)
+        rows = np.zeros(self.rows, dtype=np.uint64)
+        col0 = max(0, rect.left // self.cell_size)
+        col1 = min(self.cols - 1, (rect.right - 1) // self.cell_size)
+        row0 = max(0, rect.top // self.cell_size)
+        row1 = min(self.rows - 1, (rect.bottom - 1) // self.cell_size)
+        if col0 <= col1 and row0 <= row1:
+            rows[row0:row1 + 1] = _PREFIX_MASKS[col1 + 1] & ~_PREFIX_MASKS[col0]
+        return rows
+
+    def disc_spans(self, x, y, radius, rows=None):
+        """First and last column each disc touches in the given rows.
+
+        Takes arrays of any shape and returns (first, last, hit) arrays with an
+        extra trailing axis for `rows` (every grid row by default); `hit` is False
+        for rows the disc misses.
+        """
+        x = np.asarray(x, dtype=np.float64)[..., None]
+        y = np.asarray(y, dtype=np.float64)[..., None]
+        radius = np.asarray(radius, dtype=np.float64)[..., None]
+        if rows is None:
+            rows = np.arange(self.rows)
+        row_tops = rows * float(self.cell_size)
+        # Vertical gap between the disc center and each row band
+        dy = np.maximum(np.maximum(row_tops - y, y - (row_tops + self.cell_size)), 0)
+        hit = (dy < radius) & (rows >= 0) & (rows < self.rows)
+        half = np.sqrt(np.maximum(radius * radius - dy * dy, 0))
+        left, right = x - half, x + half
+        hit &= (right >= 0) & (left < self.cols * self.cell_size)
+        first = np.clip(np.floor(left / self.cell_size), 0, self.cols - 1).astype(np.intp)
+        last = np.clip(np.floor(right / self.cell_size), 0, self.cols - 1).astype(np.intp)
+        return first, last, hit
+
+    def disc_rows(self, x, y, radius, rows=None):
+        first, last, hit = self.disc_spans(x, y, radius, rows)
+        masks = _PREFIX_MASKS[last + 1] & ~_PREFIX_MASKS[first]
+        masks[~hit] = 0
+        return masks
+
+    def add_disc(self, x, y, radius, weight=1):
+        first, last, hit = self.disc_spans(x, y, radius)
+        for row in np.flatnonzero(hit):
+            self.coverage[row, first[row]:last[row] + 1] += weight
+
+    def remove_disc(self, x, y, radius):
+        self.add_disc(x, y, radius, weight=-1)
+
+    def blocked_rows(self):
+        bits = np.left_shift(_ONE, np.arange(self.cols, dtype=np.uint64))
+        return np.bitwise_or.reduce(np.where(self.coverage > 0, bits, np.uint64(0)), axis=1)
+
+    def reachable(self, blocked, check_every=8):
+        """Flood fill from the start area; `blocked` has shape (..., rows) and the
+        result has the leading shape of `blocked`.
+
+        All layouts are filled together, with rows on the first axis so every
+        row slice is contiguous. Every `check_every` steps the layouts that have
+        reached the end area or stopped growing are dropped, and the rest are
+        flooded up and down their columns in one go.
+        """
+        blocked = np.asarray(blocked)
+        free = np.ascontiguousarray((~blocked.reshape(-1, self.rows) & self.col_mask).T)
+        end_rows = np.flatnonzero(self.end_rows)
+        end = self.end_rows[end_rows, None]
+        reach = free & self.start_rows[:, None]
+        result = np.zeros(free.shape[1], dtype=bool)
+        active = np.arange(free.shape[1])
+        step = 0
+        while active.size:
+            step += 1
+            spread = reach << _ONE
+            spread |= reach
+            spread |= reach >> _ONE
+            spread[1:] |= reach[:-1]
+            spread[:-1] |= reach[1:]
+            spread &= free
+            if step % check_every == 0:
+                hit = (spread[end_rows] & end).any(axis=0)
+                done = hit | (spread == reach).all(axis=0)
+                result[active[hit]] = True
+                active, spread, free = active[~done], spread[:, ~done], free[:, ~done]
+                spread = _fill_columns(spread, free)
+            reach = spread
+        return result.reshape(blocked.shape[:-1])
+
+    def is_clear(self):
+        return bool(self.reachable(self.blocked_rows()))
+
+    def population_clear(self, population):
+        """Check a (population, ropes, 4) array of rope layouts against this grid."""
+        population = np.asarray(population)
+        x, y = population[..., 0], population[..., 1]
+        reach = population[..., 2] * population[..., 3]
+
+        # Only rasterize the rows around each rope instead of the whole grid
+        span = int(np.ceil(reach.max() / self.cell_size)) + 1 if reach.size else 0
+        rows = (y // self.cell_size)[..., None] + np.arange(-span, span + 1)
+        masks = self.disc_rows(x, y, reach, rows)
+
+        padded = np.zeros(population.shape[:-2] + (self.rows + 2 * span,), dtype=np.uint64)
+        layout = np.arange(len(population)).reshape(-1, 1, 1)
+        np.bitwise_or.at(padded, (layout, rows + span), masks)
+        blocked = padded[..., span:span + self.rows] | self.blocked_rows()
+        return self.reachable(blocked)
+
+    def layout_clear(self, rope_config):
+        return bool(self.population_clear(np.asarray(rope_config)[None])[0])
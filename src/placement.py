@@ -0,0 +1,67 @@
+import math
+import random
+import pygame
+
+class SpatialPlacer:
+    """Places entities with a minimum spacing using dart throwing over a grid hash.
+
+    Every placed entity keeps a personal-space radius; two entities may not be
+    closer than the sum of their radii. Candidates are only tested against the
+    grid cells around them, so placing n entities costs O(n) on average.
+    Rects in `keep_out` (e.g. the start and end corridors) never receive entities.
+    """
+
+    def __init__(self, world_size, cell_size=128, margin=100, keep_out=(), rng=random):
+        self.world_size = world_size
+        self.cell_size = cell_size
+        self.margin = margin
+        self.keep_out = [pygame.Rect(rect) for rect in keep_out]
+        self.rng = rng
+        self.cells = {}
+        self.max_radius = 0
+
+    def cell_of(self, position):
+        return int(position[0] // self.cell_size), int(position[1] // self.cell_size)
+
+    def add(self, position, radius):
+        self.cells.setdefault(self.cell_of(position), []).append((position[0], position[1], radius))
+        self.max_radius = max(self.max_radius, radius)
+
+    def is_free(self, position, radius):
+        x, y = position
+        for rect in self.keep_out:
+            # Circle vs rect: distance from the center to the closest point of the rect
+            dx = max(rect.left - x, 0, x - rect.right)
+            dy = max(rect.top - y, 0, y - rect.bottom)
+            if dx * dx + dy * dy < radius * radius:
+                return False
+
+        reach = math.ceil((radius + self.max_radius) / self.cell_size)
+        cx, cy = self.cell_of(position)
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                for ox, oy, other_radius in self.cells.get((gx, gy), ()):
+                    spacing = radius + other_radius
+                    if (ox - x) ** 2 + (oy - y) ** 2 < spacing * spacing:
+                        return False
+        return True
+
+    def sample(self, radius, attempts=30):
+        """Return a random free position for an entity of `radius`, or None."""
+        for _ in range(attempts):
+            position = (self.rng.randint(self.margin, self.world_size[0] - self.margin),
+                        self.rng.randint(self.margin, self.world_size[1] - self.margin))
+            if self.is_free(position, radius):
+                return position
+        return None
+
+    def place(self, count, radius, attempts=30):
+        """Place up to `count` entities and return their positions."""
+        positions = []
+        for _ in range(count):
+            position = self.sample(radius, attempts)
+            if position is None:
+                continue
+            self.add(position, radius)
+            positions.append(position)
+        return positions
@@ -0,0 +1,58 @@
+import numpy as np
+import pygame
+
+def point_bounds(points, num_points):
+    """(left, top, right, bottom) rows for a (rows, max points, 2) array where row k
+    only uses its first num_points[k] points."""
+    valid = (np.arange(points.shape[1]) < num_points[:, None])[..., None]
+    low = np.where(valid, points, np.inf).min(axis=1)
+    high = np.where(valid, points, -np.inf).max(axis=1)
+    return np.concatenate((low, high), axis=1)
+
+def bounding_circles(points, num_points, boxes):
+    """(x, y, radius) rows: a circle around each box center holding the row's points."""
+    valid = np.arange(points.shape[1]) < num_points[:, None]
+    centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+    offsets = points - centers[:, None]
+    distance = np.where(valid, np.sqrt(offsets[..., 0] ** 2 + offsets[..., 1] ** 2), 0)
+    return np.concatenate((centers, distance.max(axis=1)[:, None]), axis=1)
+
+class PointsView:
+    """List-like window onto one entity's rows of a batched world array.
+
+    Items are read as fresh pygame.Vector2 copies and written back on
+    assignment, so `view[0] += force` and `view[-1] = anchor` work as they did
+    on the old list of vectors.
+    """
+
+    def __init__(self, world, name, slot):
+        self.world = world
+        self.name = name
+        self.slot = slot
+
+    def __len__(self):
+        return int(self.world.num_points[self.slot])
+
+    def _index(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("point index out of range")
+        return i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [pygame.Vector2(x, y) for x, y in self.array()[i].tolist()]
+        return pygame.Vector2(*getattr(self.world, self.name)[self.slot, self._index(i)])
+
+    def __setitem__(self, i, value):
+        getattr(self.world, self.name)[self.slot, self._index(i)] = (value[0], value[1])
+
+    def __iter__(self):
+        for x, y in getattr(self.world, self.name)[self.slot, :len(self)].tolist():
+            yield pygame.Vector2(x, y)
+
+    def array(self):
+        """The entity's live (points, 2) array, without copying."""
+        return getattr(self.world, self.name)[self.slot, :len(self)]
@@ -0,0 +1,80 @@
+from collections import namedtuple
+from Chain import Chain
+from SlimeObstacle import SlimeObstacle
+from smart_verlet_rope import SmartVerletRope
+
+QualityLevel = namedtuple('QualityLevel', 'name texture_passes hairs bulges body_segments slime_highlight lod_scale')
+
+# From full detail down; lod_scale shrinks the simulation LOD distances
+QUALITY_LEVELS = (
+    QualityLevel('full', 3, True, True, 15, True, 1.0),
+    QualityLevel('high', 1, True, True, 15, True, 1.0),
+    QualityLevel('medium', 1, False, True, 10, True, 1.0),
+    QualityLevel('low', 0, False, False, 8, False, 0.75),
+    QualityLevel('minimal', 0, False, False, 5, False, 0.5),
+)
+
+class QualityGovernor:
+    """Trades render and simulation detail for frame time.
+
+    Feed `update()` the milliseconds each frame spent updating and drawing,
+    without the wait for the frame cap. When the smoothed frame time stays
+    above `target_ms` for `patience` frames, the governor drops one quality
+    level. Once it has stayed below `headroom` times the target for `recovery`
+    frames, it climbs back one level. Single slow frames (a level being built)
+    are clipped so they cannot drop the quality on their own. `level`,
+    `name` and `frame_ms` are public for telemetry.
+    """
+
+    def __init__(self, sim_lod, target_ms=14.0, headroom=0.6, patience=15, recovery=120, smoothing=0.1):
+        self.sim_lod = sim_lod
+        self.base_limits = list(sim_lod.limits)
+        self.target_ms = target_ms
+        self.headroom = headroom
+        self.patience = patience
+        self.recovery = recovery
+        self.smoothing = smoothing
+        self.frame_ms = None
+        self.level = 0
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.apply()
+
+    @property
+    def name(self):
+        return QUALITY_LEVELS[self.level].name
+
+    def update(self, frame_ms):
+        frame_ms = min(frame_ms, 3 * self.target_ms)
+        if self.frame_ms is None:
+            self.frame_ms = frame_ms
+        self.frame_ms += (frame_ms - self.frame_ms) * self.smoothing
+
+        if self.frame_ms > self.target_ms:
+            self.slow_frames += 1
+            self.fast_frames = 0
+        elif self.frame_ms < self.target_ms * self.headroom:
+            self.fast_frames += 1
+            self.slow_frames = 0
+        else:
+            self.slow_frames = self.fast_frames = 0
+
+        if self.slow_frames >= self.patience and self.level < len(QUALITY_LEVELS) - 1:
+            self.set_level(self.level + 1)
+        elif self.fast_frames >= self.recovery and self.level > 0:
+            self.set_level(self.level - 1)
+        return self.level
+
+    def set_level(self, level):
+        self.level = level
+        self.slow_frames = self.fast_frames = 0
+        self.apply()
+
+    def apply(self):
+        quality = QUALITY_LEVELS[self.level]
+        SmartVerletRope.TEXTURE_PASSES = quality.texture_passes
+        SmartVerletRope.DRAW_HAIRS = quality.hairs
+        SmartVerletRope.DRAW_BULGES = quality.bulges
+        Chain.BODY_SEGMENTS = quality.body_segments
+        SlimeObstacle.DRAW_HIGHLIGHT = quality.slime_highlight
+        self.sim_lod.set_limits([limit * quality.lod_scale for limit in self.base_limits])
@@ -1,85 +1,241 @@
-import random
-import pygame
-
-class RopeOptimizer:
-    def __init__(self, window_size, num_of_ropes, start_area, end_area):
-        self.window_size = window_size
-        self.num_of_ropes = num_of_ropes
-        self.start_area = start_area
-        self.end_area = end_area
-
-    def init_population(self):
-        population = []
-        for _ in range(100):
-            rope_config = [
-                (random.randint(50, self.window_size[0] - 50), random.randint(50, self.window_size[1] - 100),
-                 random.randint(3, 7), random.randint(30, 35))
-                for _ in range(self.num_of_ropes)
-            ]
-            population.append(rope_config)
-        return population
-
-    def fitness(self, ropes):
-        score = 0
-        for (x, y, length, points) in ropes:
-            rope_range = length * points
-            # Calculate the effective area the rope can reach
-            rope_end_pos = pygame.Rect(x - rope_range, y - rope_range, rope_range * 2, rope_range * 2)
-            
-            # Penalize if a rope can reach the safe zones
-            if self.start_area.colliderect(rope_end_pos):
-                score -= 100  # Heavily penalize overlapping with the start area
-            elif self.end_area.colliderect(rope_end_pos):
-                score -= 100  # Heavily penalize overlapping with the end area
-            else:
-                score += 1  # Reward configuration that doesn't interfere
-
-        # Check reachability (this is still a placeholder)
-        path_clear = self.is_path_clear(ropes)
-        if path_clear:
-            score += 100
-
-        return score
-
-    def is_path_clear(self, rope_config):
-        # Implement a pathfinding algorithm to ensure there is always a path from start to end
-        return True
-
-    def evolve(self):
-        population = self.init_population()
-        
-        for _ in range(1000):
-            population = sorted(population, key=self.fitness, reverse=True)
-            selected = population[:20]
-
-            new_population = []
-            while len(new_population) < 100:
-                parent1, parent2 = random.sample(selected, 2)
-                crossover_point = random.randint(0, self.num_of_ropes - 1)
-                child1 = parent1[:crossover_point] + parent2[crossover_point:]
-                child2 = parent2[:crossover_point] + parent1[crossover_point:]
-                
-                if random.random() < 0.1:
-                    rope_idx = random.randint(0, self.num_of_ropes - 1)
-                    child1[rope_idx] = self.mutate(child1[rope_idx])
-                if random.random() < 0.1:
-                    rope_idx = random.randint(0, self.num_of_ropes - 1)
-                    child2[rope_idx] = self.mutate(child2[rope_idx])
-                
-                new_population.extend([child1, child2])
-
-            population = new_population
-        
-        return population[0]
-
-    def mutate(self, rope):
-        x, y, length, points = rope
-        x = min(max(50, x + random.randint(-10, 10)), self.window_size[0] - 50)
-        y = min(max(50, y + random.randint(-10, 10)), self.window_size[1] - 100)
-        length = random.randint(3, 7)
-        points = random.randint(30, 35)
-        return x, y, length, points
-
-def generate_optimized_ropes(window_size, num_of_ropes, start_area, end_area):
-    optimizer = RopeOptimizer(window_size, num_of_ropes, start_area, end_area)
-    return optimizer.evolve()
\ No newline at end of file
+from concurrent.futures import ProcessPoolExecutor
+import time
+import numpy as np
+import pygame
+from path_grid import PathGrid
+
+class RopeOptimizer:
+    def __init__(self, window_size, num_of_ropes, start_area, end_area,
+                 population_size=100, elite_size=20, mutation_rate=0.1, seed=None, obstacles=()):
+        self.window_size = window_size
+        self.num_of_ropes = num_of_ropes
+        self.start_area = pygame.Rect(start_area)
+        self.end_area = pygame.Rect(end_area)
+        self.population_size = population_size
+        self.elite_size = elite_size
+        self.mutation_rate = mutation_rate
+        self.rng = np.random.default_rng(seed)
+        # Safe zones as (left, top, right, bottom) rows for the batched overlap test
+        self.safe_zones = np.array([
+            (area.left, area.top, area.right, area.bottom)
+            for area in (self.start_area, self.end_area)
+        ])
+        # Static (x, y, radius) blockers such as slimes are stamped into the grid once
+        self.obstacles = [tuple(obstacle) for obstacle in obstacles]
+        self.path_grid = PathGrid(window_size, self.start_area, self.end_area)
+        for obstacle in self.obstacles:
+            self.path_grid.add_disc(*obstacle)
+
+    def init_population(self):
+        """Random population as an int array of shape (population, ropes, 4)."""
+        shape = (self.population_size, self.num_of_ropes)
+        population = np.empty(shape + (4,), dtype=np.int64)
+        population[..., 0] = self.rng.integers(50, self.window_size[0] - 50, shape, endpoint=True)
+        population[..., 1] = self.rng.integers(50, self.window_size[1] - 100, shape, endpoint=True)
+        population[..., 2] = self.rng.integers(3, 7, shape, endpoint=True)
+        population[..., 3] = self.rng.integers(30, 35, shape, endpoint=True)
+        return population
+
+    def population_fitness(self, population):
+        """Score every configuration of a (population, ropes, 4) array in one pass."""
+        population = np.asarray(population)
+        x, y = population[..., 0], population[..., 1]
+        rope_range = population[..., 2] * population[..., 3]
+        left, top = x - rope_range, y - rope_range
+        right, bottom = x + rope_range, y + rope_range
+
+        # Same test as pygame.Rect.colliderect between each reach square and safe zone
+        overlaps = np.zeros(x.shape, dtype=bool)
+        for zone_left, zone_top, zone_right, zone_bottom in self.safe_zones.tolist():
+            overlaps |= ((left < zone_right) & (right > zone_left) &
+                         (top < zone_bottom) & (bottom > zone_top))
+
+        # -100 for every rope that can reach a safe zone, +1 for every rope that can't
+        scores = population.shape[-2] - 101 * np.count_nonzero(overlaps, axis=-1)
+        scores += 100 * self.path_clear_mask(population)
+        return scores
+
+    def fitness(self, ropes):
+        return int(self.population_fitness(np.asarray(ropes)[None])[0])
+
+    def path_clear_mask(self, population):
+        return self.path_grid.population_clear(population)
+
+    def is_path_clear(self, rope_config):
+        # The start area must connect to the end area around every rope's reach disc
+        return self.path_grid.layout_clear(rope_config)
+
+    def rank(self, population):
+        """Return the population sorted best-first along with the sorted scores."""
+        scores = self.population_fitness(population)
+        order = np.argsort(-scores, kind='stable')
+        return population[order], scores[order]
+
+    def max_score(self):
+        """Best achievable score: every rope clear of the safe zones plus the path bonus."""
+        return self.num_of_ropes + 100
+
+    def next_generation(self, population):
+        ranked, _ = self.rank(population)
+        return self.breed(ranked)
+
+    def breed(self, ranked):
+        selected = ranked[:self.elite_size]
+
+        # Pick two distinct parents per pair and cross them over at a random rope
+        num_pairs = (self.population_size + 1) // 2
+        first = self.rng.integers(0, self.elite_size, num_pairs)
+        second = (first + self.rng.integers(1, self.elite_size, num_pairs)) % self.elite_size
+        crossover_point = self.rng.integers(0, self.num_of_ropes, num_pairs)
+
+        # Children come in pairs: (parent1 head + parent2 tail, parent2 head + parent1 tail)
+        head = np.column_stack((first, second)).ravel()[:self.population_size]
+        tail = np.column_stack((second, first)).ravel()[:self.population_size]
+        split = np.repeat(crossover_point, 2)[:self.population_size]
+        from_head = (np.arange(self.num_of_ropes) < split[:, None])[..., None]
+        children = np.where(from_head, selected[head], selected[tail])
+
+        mutated = np.flatnonzero(self.rng.random(len(children)) < self.mutation_rate)
+        rope_idx = self.rng.integers(0, self.num_of_ropes, len(mutated))
+        children[mutated, rope_idx] = self.mutate(children[mutated, rope_idx])
+        return children
+
+    def evolve(self, generations=1000, stagnation_limit=None, target_score=None,
+               time_budget=None, on_generation=None):
+        """Run the GA and return the best layout found.
+
+        Stops early once the best score has not improved for `stagnation_limit`
+        generations, reaches `target_score`, or `time_budget` seconds have passed.
+        `on_generation(generation, best_score, mean_score)` is called after every
+        generation is scored.
+        """
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        population = self.init_population()
+        best_layout, best_score = None, None
+        stagnant = 0
+
+        for generation in range(generations + 1):
+            ranked, scores = self.rank(population)
+            if best_score is None or scores[0] > best_score:
+                best_layout, best_score = ranked[0].copy(), int(scores[0])
+                stagnant = 0
+            else:
+                stagnant += 1
+
+            if on_generation is not None:
+                on_generation(generation, int(scores[0]), float(scores.mean()))
+
+            if generation == generations:
+                break
+            if target_score is not None and best_score >= target_score:
+                break
+            if stagnation_limit is not None and stagnant >= stagnation_limit:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            population = self.breed(ranked)
+
+        return [tuple(int(v) for v in rope) for rope in best_layout]
+
+    def mutate(self, ropes):
+        """Mutate a (n, 4) array of ropes: nudge the anchor, reroll length and points."""
+        ropes = np.array(ropes, dtype=np.int64).reshape(-1, 4)
+        n = len(ropes)
+        ropes[:, 0] = np.clip(ropes[:, 0] + self.rng.integers(-10, 10, n, endpoint=True),
+                              50, self.window_size[0] - 50)
+        ropes[:, 1] = np.clip(ropes[:, 1] + self.rng.integers(-10, 10, n, endpoint=True),
+                              50, self.window_size[1] - 100)
+        ropes[:, 2] = self.rng.integers(3, 7, n, endpoint=True)
+        ropes[:, 3] = self.rng.integers(30, 35, n, endpoint=True)
+        return ropes
+
+def _evolve_island(args):
+    # Runs in a worker process: rebuild the optimizer, resume its RNG and run one epoch
+    settings, population, rng_state, generations = args
+    optimizer = RopeOptimizer(**settings)
+    optimizer.rng.bit_generator.state = rng_state
+    for _ in range(generations):
+        population = optimizer.next_generation(population)
+    return population, optimizer.rng.bit_generator.state
+
+class IslandRopeOptimizer:
+    """Runs one RopeOptimizer population per worker process and migrates elites
+    around a ring of islands every `migration_interval` generations."""
+
+    def __init__(self, window_size, num_of_ropes, start_area, end_area, workers=4, seed=None,
+                 migration_interval=50, migration_size=5, obstacles=()):
+        self.settings = dict(window_size=tuple(window_size), num_of_ropes=num_of_ropes,
+                             start_area=tuple(pygame.Rect(start_area)),
+                             end_area=tuple(pygame.Rect(end_area)),
+                             obstacles=[tuple(obstacle) for obstacle in obstacles])
+        self.workers = workers
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        # One independent stream per island so results only depend on seed and worker count
+        self.islands = [RopeOptimizer(**self.settings, seed=child)
+                        for child in np.random.SeedSequence(seed).spawn(workers)]
+
+    def max_score(self):
+        return self.islands[0].max_score()
+
+    def migrate(self, populations):
+        ranked = [island.rank(population)[0] for island, population in zip(self.islands, populations)]
+        migrated = []
+        for i, population in enumerate(ranked):
+            # The previous island's elites replace this island's worst configurations
+            elites = ranked[i - 1][:self.migration_size]
+            migrated.append(np.concatenate((population[:-self.migration_size], elites)))
+        return migrated
+
+    def evolve(self, generations=1000, stagnation_limit=None, target_score=None,
+               time_budget=None, on_generation=None):
+        """Same stopping criteria as RopeOptimizer.evolve, checked at every migration."""
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        populations = [island.init_population() for island in self.islands]
+        best_layout, best_score = None, None
+        last_improvement = 0
+        completed = 0
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                ranked = [island.rank(population) for island, population in zip(self.islands, populations)]
+                scores = np.concatenate([island_scores for _, island_scores in ranked])
+                for layouts, island_scores in ranked:
+                    if best_score is None or island_scores[0] > best_score:
+                        best_layout, best_score = layouts[0].copy(), int(island_scores[0])
+                        last_improvement = completed
+
+                if on_generation is not None:
+                    on_generation(completed, best_score, float(scores.mean()))
+
+                if completed >= generations:
+                    break
+                if target_score is not None and best_score >= target_score:
+                    break
+                if stagnation_limit is not None and completed - last_improvement >= stagnation_limit:
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+
+                if completed > 0 and self.workers > 1:
+                    populations = self.migrate(populations)
+                epoch = min(self.migration_interval, generations - completed)
+                jobs = [(self.settings, population, island.rng.bit_generator.state, epoch)
+                        for island, population in zip(self.islands, populations)]
+                results = list(pool.map(_evolve_island, jobs))
+                populations = [population for population, _ in results]
+                for island, (_, rng_state) in zip(self.islands, results):
+                    island.rng.bit_generator.state = rng_state
+                completed += epoch
+
+        return [tuple(int(v) for v in rope) for rope in best_layout]
+
+def generate_optimized_ropes(window_size, num_of_ropes, start_area, end_area, seed=None, workers=None,
+                             stagnation_limit=100, time_budget=None, on_generation=None):
+    if workers:
+        optimizer = IslandRopeOptimizer(window_size, num_of_ropes, start_area, end_area,
+                                        workers=workers, seed=seed)
+    else:
+        optimizer = RopeOptimizer(window_size, num_of_ropes, start_area, end_area, seed=seed)
+    return optimizer.evolve(stagnation_limit=stagnation_limit, target_score=optimizer.max_score(),
+                            time_budget=time_budget, on_generation=on_generation)
@@ -0,0 +1,119 @@
+import math
+from collections import OrderedDict
+import pygame
+
+class RopeSpriteAtlas:
+    """Pre-rendered rope segments, hair tufts and bulges, shared by all ropes.
+
+    Each sprite is drawn once per rope and per quantized angle, length and
+    thickness, and after that it is only blitted, centered on its anchor
+    point. Jitter comes from the rope's recorded visuals (`texture_offsets`,
+    `hair_angles`, `hair_lengths`) instead of fresh random numbers on every
+    frame, so a sprite can be reused. Every rope that starts drawing from the
+    atlas with `add_rope()` adds `sprites_per_rope` to the capacity, and the
+    least recently used sprites are dropped once there are more than that.
+    """
+
+    def __init__(self, sprites_per_rope=256, angle_steps=64, wave_steps=4):
+        self.sprites_per_rope = sprites_per_rope
+        self.capacity = 0
+        self.angle_steps = angle_steps
+        self.wave_steps = wave_steps
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def add_rope(self):
+        self.capacity += self.sprites_per_rope
+
+    def clear(self):
+        self.sprites.clear()
+        self.capacity = 0
+
+    def quantize_angle(self, angle):
+        step = round(angle / (2 * math.pi) * self.angle_steps) % self.angle_steps
+        return step, step * 2 * math.pi / self.angle_steps
+
+    def _get(self, key, render, *args):
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = self.sprites[key] = render(*args)
+        if len(self.sprites) > self.capacity:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def segment(self, rope, length, thickness1, thickness2, angle, passes=3):
+        """Textured quad from one rope point to the next, centered on their midpoint,
+        with `passes` jittered outlines on top."""
+        step, angle = self.quantize_angle(angle)
+        length, thickness1, thickness2 = round(length), round(thickness1), round(thickness2)
+        key = (rope.rope_id, 'segment', step, length, thickness1, thickness2, passes)
+        return self._get(key, self._render_segment, rope.visuals, length, thickness1, thickness2, angle, passes)
+
+    def hair_waves(self, rope, time):
+        """Quantized sway of a rope's three hairs at `time`, shared by all its tufts."""
+        return tuple(round(math.sin(time * wave + i) * self.wave_steps)
+                     for i, wave in enumerate(rope.visuals['hair_waves'][:3]))
+
+    def hairs(self, rope, thickness, angle, waves):
+        """Tuft of three hairs growing from a rope point, centered on that point."""
+        step, angle = self.quantize_angle(angle)
+        thickness = round(thickness)
+        key = (rope.rope_id, 'hairs', step, thickness, waves)
+        return self._get(key, self._render_hairs, rope.visuals, thickness, angle, waves)
+
+    def bulge(self, rope, radius):
+        """Lumpy growth centered on a rope point."""
+        radius = max(1, round(radius))
+        return self._get((rope.rope_id, 'bulge', radius), self._render_bulge, rope.visuals, radius)
+
+    def _render_segment(self, visuals, length, thickness1, thickness2, angle, passes):
+        # Room for the widest end plus the outline jitter on every side
+        half = length / 2 + max(thickness1, thickness2) + 3
+        surface = pygame.Surface((math.ceil(2 * half), math.ceil(2 * half)), pygame.SRCALPHA)
+        direction = pygame.Vector2(math.cos(angle), math.sin(angle))
+        perp = pygame.Vector2(-direction.y, direction.x)
+        p1 = pygame.Vector2(half, half) - direction * (length / 2)
+        p2 = pygame.Vector2(half, half) + direction * (length / 2)
+        points = [p1 + perp * thickness1, p2 + perp * thickness2, p2 - perp * thickness2, p1 - perp * thickness1]
+        pygame.draw.polygon(surface, visuals['base_color'], points)
+
+        for offset, _ in visuals['texture_offsets'][:passes]:
+            texture_points = [(p[0] + math.sin(i) * offset, p[1] + math.cos(i) * offset)
+                              for i, p in enumerate(points)]
+            pygame.draw.polygon(surface, visuals['highlight_color'], texture_points, 1)
+        return surface
+
+    def _render_hairs(self, visuals, thickness, angle, waves):
+        width = max(1, int(thickness * 0.15))
+        half = thickness * 2.5 + width + 1
+        surface = pygame.Surface((math.ceil(2 * half), math.ceil(2 * half)), pygame.SRCALPHA)
+        for i, wave in enumerate(waves):
+            # Spread and length in the same ranges the per-frame random draws used
+            base_angle = angle + (visuals['hair_angles'][i] / (2 * math.pi) - 0.5) * math.pi / 2
+            hair_length = thickness * (1.5 + (visuals['hair_lengths'][i] - 5) / 10)
+            wave /= self.wave_steps
+
+            points = []
+            steps = 5
+            for step in range(steps):
+                t = step / (steps - 1)
+                offset_angle = base_angle + wave * t * math.pi/4
+                points.append((half + math.cos(offset_angle) * hair_length * t,
+                               half + math.sin(offset_angle) * hair_length * t))
+            pygame.draw.lines(surface, visuals['hair_color'], False, points, width)
+        return surface
+
+    def _render_bulge(self, visuals, radius):
+        half = radius + 3
+        surface = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+        pygame.draw.circle(surface, visuals['highlight_color'], (half, half), radius)
+        for offset, scale in visuals['texture_offsets'][:3]:
+            # texture offsets are in [-2, 2]; map the second one to a 0.5-0.8 radius
+            pygame.draw.circle(surface, visuals['base_color'], (half + offset, half + offset),
+                               radius * (0.65 + scale * 0.075))
+        return surface
@@ -0,0 +1,212 @@
+import math
+import numpy as np
+from points_view import bounding_circles, point_bounds
+
+class RopeWorld:
+    """Structure-of-arrays store and batched Verlet solver for many ropes.
+
+    Every rope owns one slot; its points and velocities live in shared arrays
+    of shape (ropes, max points, 2), padded past each rope's own point count.
+    Ropes queue themselves with `queue()` during their update and `step()`
+    then integrates every queued rope at once and projects their distance
+    constraints, rope by rope on floats for typical batch sizes. With
+    `deferred=False` each queued rope is stepped immediately, which is what a
+    standalone rope uses. `interpolate()` fills `render_points` with positions
+    between the last two steps for drawing.
+    """
+
+    # Batches up to this many ropes are relaxed one rope at a time on floats;
+    # the per-index NumPy passes only break even at around 60 ropes
+    FLOAT_BATCH_LIMIT = 48
+
+    def __init__(self, capacity=64, max_points=36, iterations=3, deferred=True, seed=None):
+        self.iterations = iterations
+        self.deferred = deferred
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.points = np.zeros((capacity, max_points, 2))
+        self.velocities = np.zeros((capacity, max_points, 2))
+        self.previous_points = np.zeros((capacity, max_points, 2))
+        self.render_points = np.zeros((capacity, max_points, 2))
+        self.anchors = np.zeros((capacity, 2))
+        self.num_points = np.zeros(capacity, dtype=np.intp)
+        self.segment_lengths = np.zeros(capacity)
+        self.damping = np.zeros(capacity)
+        self.wiggle_amplitudes = np.zeros((capacity, max_points))
+        self.wiggle_frequencies = np.zeros((capacity, max_points))
+        self.wiggle_phases = np.zeros((capacity, max_points))
+        self.times = np.zeros(capacity)
+        self.idle = np.zeros(capacity, dtype=bool)
+        self.iteration_counts = np.zeros(capacity, dtype=np.intp)
+        # Bounding box (left, top, right, bottom) per rope
+        self.aabbs = np.zeros((capacity, 4))
+        self.queued = []
+
+    def _grow(self, capacity, max_points):
+        capacity = max(capacity, self.points.shape[0])
+        max_points = max(max_points, self.points.shape[1])
+        for name in ('points', 'velocities', 'previous_points', 'render_points',
+                     'wiggle_amplitudes', 'wiggle_frequencies', 'wiggle_phases'):
+            old = getattr(self, name)
+            new = np.zeros((capacity, max_points) + old.shape[2:])
+            new[:old.shape[0], :old.shape[1]] = old
+            setattr(self, name, new)
+        for name in ('anchors', 'num_points', 'segment_lengths', 'damping', 'times', 'idle',
+                     'iteration_counts', 'aabbs'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add_rope(self, num_points):
+        """Reserve a slot for a rope of `num_points` points and return it."""
+        if self.count >= self.points.shape[0] or num_points > self.points.shape[1]:
+            self._grow(max(self.count + 1, self.points.shape[0] * 2), num_points)
+        slot = self.count
+        self.count += 1
+        self.num_points[slot] = num_points
+        return slot
+
+    def reset_rope(self, slot, anchor_pos, segment_length, damping):
+        self.points[slot] = anchor_pos
+        self.previous_points[slot] = anchor_pos
+        self.render_points[slot] = anchor_pos
+        self.velocities[slot] = 0
+        self.anchors[slot] = anchor_pos
+        self.segment_lengths[slot] = segment_length
+        self.damping[slot] = damping
+        self.times[slot] = 0
+        self.aabbs[slot] = (anchor_pos[0], anchor_pos[1], anchor_pos[0], anchor_pos[1])
+
+    def set_wiggle(self, slot, amplitudes, frequencies, phases):
+        n = len(amplitudes)
+        self.wiggle_amplitudes[slot, :n] = amplitudes
+        self.wiggle_frequencies[slot, :n] = frequencies
+        self.wiggle_phases[slot, :n] = phases
+
+    def queue(self, slot, idle, time, iterations=None):
+        """Schedule one physics step for a rope; `idle` adds the idle wiggle and
+        `iterations` overrides the number of constraint passes."""
+        self.idle[slot] = idle
+        self.times[slot] = time
+        self.iteration_counts[slot] = self.iterations if iterations is None else iterations
+        self.queued.append(slot)
+        if not self.deferred:
+            self.step()
+
+    def step(self):
+        self.previous_points[:self.count] = self.points[:self.count]
+        if not self.queued:
+            return
+        slots = np.array(self.queued, dtype=np.intp)
+        self.queued = []
+
+        points = self.points[slots]
+        velocities = self.velocities[slots]
+        n = self.num_points[slots]
+        segment = self.segment_lengths[slots][:, None]
+        width = int(n.max())
+        points, velocities = points[:, :width], velocities[:, :width]
+        index = np.arange(width)
+        # Every point but the anchor moves
+        movable = index < (n - 1)[:, None]
+
+        idle = self.idle[slots]
+        if idle.any():
+            # Pull each point toward a wiggling offset from its neighbour toward the anchor
+            angle = (self.times[slots][:, None] * self.wiggle_frequencies[slots, :width - 1] +
+                     self.wiggle_phases[slots, :width - 1])
+            perpendicular = np.stack((-np.sin(angle), np.cos(angle)), axis=-1)
+            amplitude = self.wiggle_amplitudes[slots, :width - 1] * (1 - index[:-1] / n[:, None])
+            target = points[:, 1:] + perpendicular * (amplitude * segment)[..., None]
+            pull = idle[:, None] & movable[:, :-1]
+            velocities[:, :-1] += np.where(pull[..., None], (target - points[:, :-1]) * 0.1, 0)
+            jolt = pull & (self.rng.random(pull.shape) < 0.05)
+            velocities[:, :-1] += np.where(jolt[..., None],
+                                           self.rng.uniform(-0.5, 0.5, pull.shape + (2,)), 0)
+
+        velocities *= np.where(movable, self.damping[slots][:, None], 1)[..., None]
+        points += np.where(movable[..., None], velocities, 0)
+
+        iterations = self.iteration_counts[slots]
+        if len(slots) <= self.FLOAT_BATCH_LIMIT:
+            # A few ropes are faster one at a time on plain floats than as
+            # one NumPy call per point index
+            for row, slot in enumerate(slots):
+                count = int(n[row])
+                rope = points[row, :count].tolist()
+                self._relax_rope(rope, self.anchors[slot].tolist(), float(segment[row, 0]),
+                                 int(iterations[row]))
+                points[row, :count] = rope
+            chain = points.transpose(1, 0, 2)
+        else:
+            chain = self._relax_batch(points, n, self.anchors[slots], segment[:, 0], iterations)
+
+        self.points[slots, :width] = chain.transpose(1, 0, 2)
+        self.velocities[slots, :width] = velocities
+        self.aabbs[slots] = point_bounds(self.points[slots, :width], n)
+
+    def bounding_circle(self, slot):
+        """(x, y, radius) circle holding one rope, worked out on request."""
+        rows = slice(slot, slot + 1)
+        return bounding_circles(self.points[rows], self.num_points[rows], self.aabbs[rows])[0].tolist()
+
+    @staticmethod
+    def _relax_rope(rope, anchor, segment, iterations):
+        """Constraint passes for one rope, a list of [x, y] points, in place."""
+        segment_sq = segment * segment
+
+        def constrain(i, j):
+            x, y = rope[i]
+            ax, ay = rope[j]
+            dx, dy = x - ax, y - ay
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > segment_sq:
+                scale = segment / math.sqrt(dist_sq)
+                rope[i] = [ax + dx * scale, ay + dy * scale]
+
+        for _ in range(iterations):
+            for i in range(1, len(rope)):
+                constrain(i, i - 1)
+            rope[-1] = anchor
+            for i in range(len(rope) - 2, -1, -1):
+                constrain(i, i + 1)
+
+    def _relax_batch(self, points, n, anchors, segment, iterations):
+        """Constraint passes for many ropes at once; returns the points laid out point-major."""
+        # Constraint passes walk along the rope, so lay points out point-major
+        # to make every per-index slice contiguous across ropes
+        width = points.shape[1]
+        chain = np.ascontiguousarray(points.transpose(1, 0, 2))
+        rows = np.arange(len(n))
+        segment_sq = segment * segment
+        forward = [i < n for i in range(width)]
+        backward = [i < n - 1 for i in range(width)]
+        for iteration in range(int(iterations.max())):
+            running = iterations > iteration
+            if not running.all():
+                # Ropes with fewer passes (lower simulation detail) are done
+                forward = [active & running for active in forward]
+                backward = [active & running for active in backward]
+            for i in range(1, width):
+                self._constrain(chain[i], chain[i - 1], segment, segment_sq, forward[i])
+            chain[n - 1, rows] = anchors
+            for i in range(width - 2, -1, -1):
+                self._constrain(chain[i], chain[i + 1], segment, segment_sq, backward[i])
+        return chain
+
+    @staticmethod
+    def _constrain(point, anchor, segment, segment_sq, active):
+        """Pull `point` (one row per rope) back to within `segment` of `anchor`, in place."""
+        direction = point - anchor
+        dist_sq = direction[:, 0] * direction[:, 0] + direction[:, 1] * direction[:, 1]
+        over = active & (dist_sq > segment_sq)
+        # Whole-row arithmetic; rows within reach keep a scale of exactly 1
+        scale = np.where(over, segment / np.sqrt(np.where(over, dist_sq, 1)), 1)
+        np.copyto(point, anchor + direction * scale[:, None], where=over[:, None])
+
+    def interpolate(self, alpha):
+        """Blend every rope between its previous and current step into `render_points`."""
+        previous = self.previous_points[:self.count]
+        np.multiply(self.points[:self.count] - previous, alpha, out=self.render_points[:self.count])
+        self.render_points[:self.count] += previous
@@ -0,0 +1,48 @@
+import math
+from bisect import bisect_left
+
+# Simulation tiers, from most to least detailed
+FULL = 0
+REDUCED = 1
+DORMANT = 2
+TIER_NAMES = ("full", "reduced", "dormant")
+
+def distance_to_rect(point, rect):
+    """Distance from a point to the closest point of a rect (0 inside it)."""
+    dx = max(rect.left - point[0], 0, point[0] - rect.right)
+    dy = max(rect.top - point[1], 0, point[1] - rect.bottom)
+    return math.hypot(dx, dy)
+
+class SimulationLOD:
+    """Chooses how much simulation each entity gets from its distance to the view.
+
+    Entities provide `lod_distance(view)`, the gap between their reach and the
+    view rect, and carry a `lod_tier` attribute. Within `limits[0]` of the view
+    an entity is FULL, within `limits[1]` it is REDUCED and beyond that DORMANT.
+    An entity only drops to a coarser tier once it is `hysteresis` past the
+    limit, so entities near a boundary do not flap between tiers.
+    """
+
+    def __init__(self, limits=(100, 600), hysteresis=100):
+        self.hysteresis = hysteresis
+        self.set_limits(limits)
+        self.counts = {}
+
+    def set_limits(self, limits):
+        self.limits = list(limits)
+        self.demote_limits = [limit + self.hysteresis for limit in limits]
+
+    def classify(self, tier, distance):
+        target = bisect_left(self.limits, distance)
+        if target > tier:
+            target = max(tier, bisect_left(self.demote_limits, distance))
+        return target
+
+    def update(self, kind, entities, view):
+        """Re-tier `entities` against the `view` rect and count them under `kind`."""
+        counts = [0] * len(TIER_NAMES)
+        for entity in entities:
+            entity.lod_tier = self.classify(entity.lod_tier, entity.lod_distance(view))
+            counts[entity.lod_tier] += 1
+        self.counts[kind] = dict(zip(TIER_NAMES, counts))
+        return self.counts[kind]
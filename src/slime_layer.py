@@ -0,0 +1,33 @@
+import pygame
+
+class SlimeLayer:
+    """Window-sized translucent layer that every visible slime is drawn into.
+
+    The layer is allocated once and blitted onto the screen with one alpha blit
+    covering only the slimes drawn this frame. Before drawing, only the rects
+    used on the previous frame are cleared.
+    """
+
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.rect = self.surface.get_rect()
+        self.dirty = []
+
+    def draw(self, screen, camera, slimes):
+        for rect in self.dirty:
+            self.surface.fill((0, 0, 0, 0), rect)
+        self.dirty = []
+
+        for slime in slimes:
+            shape = slime.shape(camera)
+            if shape is None:
+                continue
+            points, highlight, rect = shape
+            if rect.colliderect(self.rect):
+                slime.draw_shape(self.surface, points, highlight, (0, 0))
+                self.dirty.append(rect.clip(self.rect))
+
+        if self.dirty:
+            area = self.dirty[0].unionall(self.dirty[1:])
+            return screen.blit(self.surface, area.topleft, area)
+        return None
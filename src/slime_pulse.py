@@ -0,0 +1,54 @@
+import math
+import numpy as np
+from slime_world import SlimeWorld
+
+class PulseCycle:
+    """One baked loop of a slime's pulse, shared by every slime with the same
+    radius, point count and pulse strength.
+
+    The ring is run through the real soft-body solver for one warm-up cycle and
+    then recorded for two more, one keyframe per step of wobble phase. The two
+    recorded cycles are cross-faded into a single loop that closes seamlessly,
+    so replaying it by phase only costs a table lookup and a blend.
+    """
+
+    cycles = {}
+
+    def __init__(self, radius, points, pulse_strength, keyframes=189, warmup_cycles=1):
+        self.key = (radius, points, pulse_strength)
+        self.keyframes = keyframes
+        self.phase_step = 2 * math.pi / keyframes
+        world = SlimeWorld(capacity=1, max_points=points, deferred=False)
+        segment_length = (2 * math.pi * radius / points) * 0.95
+        slot = world.add_slime((0, 0), radius, points, segment_length, pulse_strength)
+
+        for step in range(1, warmup_cycles * keyframes):
+            world.queue(slot, step * self.phase_step)
+        recorded = np.empty((2 * keyframes, points, 2))
+        for j in range(2 * keyframes):
+            world.queue(slot, (warmup_cycles * keyframes + j) * self.phase_step)
+            recorded[j] = world.current_points[slot, :points]
+
+        # Fade from the second cycle into the first so the last keyframe runs
+        # straight into keyframe 0
+        weight = (np.arange(keyframes) / keyframes)[:, None, None]
+        self.shapes = recorded[keyframes:] * (1 - weight) + recorded[:keyframes] * weight
+
+    @classmethod
+    def get(cls, radius, points, pulse_strength):
+        key = (radius, points, pulse_strength)
+        if key not in cls.cycles:
+            cls.cycles[key] = cls(radius, points, pulse_strength)
+        return cls.cycles[key]
+
+    @classmethod
+    def share(cls, cycle):
+        """Reuse a cycle baked elsewhere, such as in the level prefetch worker."""
+        return cls.cycles.setdefault(cycle.key, cycle)
+
+    def sample(self, times):
+        """Ring offsets from the center for an array of wobble times, shape (len(times), points, 2)."""
+        position = np.asarray(times) % (2 * math.pi) / self.phase_step
+        first = position.astype(np.intp) % self.keyframes
+        blend = (position - np.floor(position))[:, None, None]
+        return self.shapes[first] * (1 - blend) + self.shapes[(first + 1) % self.keyframes] * blend
@@ -0,0 +1,214 @@
+import math
+import numpy as np
+from points_view import bounding_circles, point_bounds
+
+class SlimeWorld:
+    """Structure-of-arrays store and batched soft-body solver for many slimes.
+
+    Every slime owns one slot; its ring of points lives in shared arrays of
+    shape (slimes, max points, 2). Slimes queue themselves with `queue()` during
+    their update and `step()` then applies the wobble, edge-length correction and
+    center pull to every queued slime at once. The relaxation still walks each
+    ring point by point, but every step of that walk is done for all slimes with
+    the same point count together, or ring by ring on plain floats when only a
+    few slimes share a group. With `deferred=False` each queued slime is
+    stepped immediately, which is what a standalone slime uses. Slots given a
+    baked PulseCycle with `set_cycle()` replay it instead of being solved.
+    `old_points` holds each ring as it was before its last step, and
+    `interpolate()` blends the two into `render_points` for drawing.
+    """
+
+    # Groups up to this many slimes are relaxed one ring at a time on floats;
+    # the per-index NumPy passes only pay off for larger groups
+    FLOAT_BATCH_LIMIT = 32
+
+    def __init__(self, capacity=32, max_points=20, iterations=20, deferred=True):
+        self.iterations = iterations
+        self.deferred = deferred
+        self.count = 0
+        self.current_points = np.zeros((capacity, max_points, 2))
+        self.old_points = np.zeros((capacity, max_points, 2))
+        self.render_points = np.zeros((capacity, max_points, 2))
+        self.positions = np.zeros((capacity, 2))
+        self.radii = np.zeros(capacity)
+        self.num_points = np.zeros(capacity, dtype=np.intp)
+        self.segment_lengths = np.zeros(capacity)
+        self.pulse_strengths = np.zeros(capacity)
+        self.times = np.zeros(capacity)
+        self.iteration_counts = np.zeros(capacity, dtype=np.intp)
+        self.cycles = [None] * capacity
+        # Bounding box (left, top, right, bottom) per slime
+        self.aabbs = np.zeros((capacity, 4))
+        self.queued = []
+
+    def _grow(self, capacity, max_points):
+        capacity = max(capacity, self.current_points.shape[0])
+        max_points = max(max_points, self.current_points.shape[1])
+        for name in ('current_points', 'old_points', 'render_points'):
+            old = getattr(self, name)
+            new = np.zeros((capacity, max_points, 2))
+            new[:old.shape[0], :old.shape[1]] = old
+            setattr(self, name, new)
+        for name in ('positions', 'radii', 'num_points', 'segment_lengths', 'pulse_strengths', 'times',
+                     'iteration_counts', 'aabbs'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.cycles += [None] * (capacity - len(self.cycles))
+
+    def add_slime(self, position, radius, num_points, segment_length, pulse_strength):
+        """Reserve a slot for a slime, lay out its ring and return the slot."""
+        if self.count >= self.current_points.shape[0] or num_points > self.current_points.shape[1]:
+            self._grow(max(self.count + 1, self.current_points.shape[0] * 2), num_points)
+        slot = self.count
+        self.count += 1
+        self.num_points[slot] = num_points
+        self.positions[slot] = position
+        self.radii[slot] = radius
+        self.segment_lengths[slot] = segment_length
+        self.pulse_strengths[slot] = pulse_strength
+
+        angle = np.radians(360 / num_points * np.arange(num_points))
+        ring = np.stack((position[0] + radius * np.cos(angle),
+                         position[1] + radius * np.sin(angle)), axis=-1)
+        self.current_points[slot, :num_points] = ring
+        self.old_points[slot, :num_points] = ring
+        self.render_points[slot, :num_points] = ring
+        self._update_bounds(np.array([slot]))
+        return slot
+
+    def set_cycle(self, slot, cycle):
+        """Replay a baked PulseCycle for this slot (None to solve it again)."""
+        self.cycles[slot] = cycle
+
+    def queue(self, slot, time, iterations=None):
+        """Schedule one physics step for a slime at wobble time `time`;
+        `iterations` overrides the number of relaxation passes."""
+        self.times[slot] = time
+        self.iteration_counts[slot] = self.iterations if iterations is None else iterations
+        self.queued.append(slot)
+        if not self.deferred:
+            self.step()
+
+    def step(self):
+        if not self.queued:
+            return
+        stepped = np.array(self.queued, dtype=np.intp)
+        solved = []
+        replayed = {}
+        for slot in self.queued:
+            cycle = self.cycles[slot]
+            if cycle is None:
+                solved.append(slot)
+            else:
+                replayed.setdefault(cycle, []).append(slot)
+        self.queued = []
+        for cycle, slots in replayed.items():
+            self._replay_group(np.array(slots, dtype=np.intp), cycle)
+        if solved:
+            queued = np.array(solved, dtype=np.intp)
+            # Rings of different sizes wrap around at different indices, so solve
+            # each ring size (and pass count) as its own batch
+            groups = np.stack((self.num_points[queued], self.iteration_counts[queued]), axis=1)
+            for n, iterations in np.unique(groups, axis=0).tolist():
+                self._step_group(queued[(groups == (n, iterations)).all(axis=1)], n, iterations)
+        self._update_bounds(stepped)
+
+    def _update_bounds(self, slots):
+        self.aabbs[slots] = point_bounds(self.current_points[slots], self.num_points[slots])
+
+    def bounding_circle(self, slot):
+        """(x, y, radius) circle holding one slime, worked out on request."""
+        rows = slice(slot, slot + 1)
+        return bounding_circles(self.current_points[rows], self.num_points[rows], self.aabbs[rows])[0].tolist()
+
+    def interpolate(self, alpha):
+        """Blend every ring between its previous and current step into `render_points`."""
+        previous = self.old_points[:self.count]
+        np.multiply(self.current_points[:self.count] - previous, alpha, out=self.render_points[:self.count])
+        self.render_points[:self.count] += previous
+
+    def _replay_group(self, slots, cycle):
+        n = cycle.shapes.shape[1]
+        self.old_points[slots, :n] = self.current_points[slots, :n]
+        self.current_points[slots, :n] = self.positions[slots][:, None] + cycle.sample(self.times[slots])
+
+    def _step_group(self, slots, n, iterations):
+        points = self.current_points[slots, :n]
+        self.old_points[slots, :n] = points
+        center = self.positions[slots][:, None]
+
+        # Push every point along its spoke by a travelling sine wave
+        angle = self.times[slots][:, None] + np.radians(360 / n * np.arange(n))
+        wobble = np.sin(angle) * self.pulse_strengths[slots][:, None]
+        spoke = points - center
+        spoke /= np.sqrt(spoke[..., 0] ** 2 + spoke[..., 1] ** 2)[..., None]
+        points += spoke * wobble[..., None]
+
+        if len(slots) <= self.FLOAT_BATCH_LIMIT:
+            # NumPy call overhead dominates for a few rings; relax each on floats
+            for row, slot in enumerate(slots.tolist()):
+                xs, ys = points[row, :, 0].tolist(), points[row, :, 1].tolist()
+                self._relax_ring(xs, ys, float(center[row, 0, 0]), float(center[row, 0, 1]),
+                                 float(self.segment_lengths[slot]), float(self.radii[slot]), iterations)
+                self.current_points[slot, :n, 0] = xs
+                self.current_points[slot, :n, 1] = ys
+            return
+
+        # The relaxation is sequential along the ring, so lay coordinates out
+        # point-major to make every per-index slice contiguous across slimes
+        xs = np.ascontiguousarray(points[..., 0].T)
+        ys = np.ascontiguousarray(points[..., 1].T)
+        cx, cy = center[:, 0, 0].copy(), center[:, 0, 1].copy()
+        segment = self.segment_lengths[slots]
+        radius = self.radii[slots]
+        for _ in range(iterations):
+            for i in range(n):
+                j = (i + 1) % n
+                x, y, next_x, next_y = xs[i], ys[i], xs[j], ys[j]
+                dx = next_x - x
+                dy = next_y - y
+                distance = np.sqrt(dx * dx + dy * dy)
+                # A zero distance leaves dx, dy at 0, so the offset stays 0
+                correction = (distance - segment) / np.maximum(distance, 1e-12)
+                dx *= correction
+                dy *= correction
+                dx *= 0.5
+                dy *= 0.5
+                x += dx
+                y += dy
+                next_x -= dx
+                next_y -= dy
+                to_x = cx - x
+                to_y = cy - y
+                pull = (np.sqrt(to_x * to_x + to_y * to_y) > radius) * 0.1
+                x += to_x * pull
+                y += to_y * pull
+
+        self.current_points[slots, :n, 0] = xs.T
+        self.current_points[slots, :n, 1] = ys.T
+
+    @staticmethod
+    def _relax_ring(xs, ys, cx, cy, segment, radius, iterations):
+        """Same relaxation as `_step_group` for one ring held in lists of floats."""
+        n = len(xs)
+        for _ in range(iterations):
+            for i in range(n):
+                j = (i + 1) % n
+                dx = xs[j] - xs[i]
+                dy = ys[j] - ys[i]
+                distance = math.sqrt(dx * dx + dy * dy)
+                if distance > 0:
+                    correction = (distance - segment) / distance
+                    dx = dx * correction * 0.5
+                    dy = dy * correction * 0.5
+                    xs[i] += dx
+                    ys[i] += dy
+                    xs[j] -= dx
+                    ys[j] -= dy
+                to_x = cx - xs[i]
+                to_y = cy - ys[i]
+                if math.sqrt(to_x * to_x + to_y * to_y) > radius:
+                    xs[i] += to_x * 0.1
+                    ys[i] += to_y * 0.1
@@ -5,6 +5,8 @@ import math
 import random
 import json
 import os
+from sim_lod import DORMANT, FULL, REDUCED, distance_to_rect
+from spatial_hash import box_of_points, circle_around_box
 
 class QTableManager:
     _instance = None
@@ -67,15 +69,23 @@ class QTableManager:
         return max(self._q_table[state].items(), key=lambda x: x[1])[0]
 
 class SmartBlueTentacle:
+    # Constraint passes per simulation tier; dormant tentacles are not updated
+    LOD_ITERATIONS = {FULL: 3, REDUCED: 1}
+
     def __init__(self, anchor_pos, points=5, segment_length=20):
         self.points = [pygame.Vector2(anchor_pos) for _ in range(points)]
         self.velocities = [pygame.Vector2(0, 0) for _ in range(points)]
+        # Positions before the last step and the blend drawn between them
+        self.previous_points = [point.copy() for point in self.points]
+        self.render_points = [point.copy() for point in self.points]
+        self._update_bounds()
         self.segment_length = segment_length
         self.total_length = segment_length * points
         self.anchor_pos = pygame.Vector2(anchor_pos)
         self.has_coin = False
         self.is_active = False
         self.is_visible = True
+        self.lod_tier = FULL
         
         # Learning parameters
         self.learning_rate = 0.1
@@ -158,8 +168,8 @@ class SmartBlueTentacle:
             
         return base_reward
 
-    def apply_idle_motion(self):
-        self.time += 0.016
+    def apply_idle_motion(self, dt=0.016):
+        self.time += dt
         for i in range(len(self.points)):
             if i == len(self.points) - 1:
                 continue
@@ -176,15 +186,22 @@ class SmartBlueTentacle:
                 random_force = pygame.Vector2(random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
                 self.velocities[i] += random_force
 
-    def update(self, chain, coin):
-        if not self.is_visible and not self.has_coin:
+    def update(self, chain, coin, dt=0.016):
+        self.previous_points = [point.copy() for point in self.points]
+        # A tentacle carrying the coin keeps moving wherever it is
+        tier = FULL if self.has_coin else self.lod_tier
+        if tier == DORMANT:
             return
             
         if not self.is_active:
             if (pygame.Vector2(chain.joints[0]) - self.anchor_pos).length() <= self.total_length * 1.5:
                 self.is_active = True
                 
-        if self.is_active and not self.has_coin:
+        if self.is_active and not self.has_coin and tier == REDUCED:
+            # Away from the view: idle motion only, no decisions or learning
+            if self.state != "striking":
+                self.apply_idle_motion(dt)
+        elif self.is_active and not self.has_coin:
             current_head = self.points[0]
             distance_to_coin = (coin.position - current_head).length()
             distance_to_chain = (pygame.Vector2(chain.joints[0]) - current_head).length()
@@ -203,9 +220,9 @@ class SmartBlueTentacle:
             self._update_q_values(action, reward, distance_to_coin, distance_to_chain)
 
             if self.state != "striking":
-                self.apply_idle_motion()
+                self.apply_idle_motion(dt)
 
-        self._update_physics()
+        self._update_physics(self.LOD_ITERATIONS[tier])
         
         if self.has_coin:
             coin.position = self.points[0]
@@ -249,18 +266,32 @@ class SmartBlueTentacle:
         self.q_manager.update_q_value(self.current_state, action, new_value)
         self.previous_distance = distance
 
-    def _update_physics(self):
+    def _update_physics(self, iterations=3):
         for i in range(len(self.points) - 1):
             if i != len(self.points) - 1:
                 self.velocities[i] *= self.damping
             self.points[i] += self.velocities[i]
 
-        for _ in range(3):
+        for _ in range(iterations):
             for i in range(1, len(self.points)):
                 self.points[i] = self.constrain_distance(self.points[i], self.points[i - 1], self.segment_length)
             self.points[-1] = self.anchor_pos
             for i in range(len(self.points) - 2, -1, -1):
                 self.points[i] = self.constrain_distance(self.points[i], self.points[i + 1], self.segment_length)
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """Cache the bounding box of the current points."""
+        self.aabb = box_of_points(self.points)
+
+    @property
+    def bounding_circle(self):
+        """(x, y, radius) circle holding the tentacle, worked out on request."""
+        return circle_around_box(self.aabb, self.points)
+
+    def interpolate(self, alpha):
+        self.render_points = [previous.lerp(point, alpha)
+                              for previous, point in zip(self.previous_points, self.points)]
 
     def constrain_distance(self, point, anchor, distance):
         direction = point - anchor
@@ -270,28 +301,19 @@ class SmartBlueTentacle:
             return anchor + normalized * distance
         return point
 
-    def is_in_view(self, camera, window_size):
-        for point in self.points:
-            screen_pos = camera.apply(point)
-            if (0 <= screen_pos.x <= window_size[0] and 
-                0 <= screen_pos.y <= window_size[1]):
-                return True
-        
-        if not self.is_active:
-            screen_pos = camera.apply(self.anchor_pos)
-            if (0 <= screen_pos.x <= window_size[0] and 
-                0 <= screen_pos.y <= window_size[1]):
-                return True
-        
-        return False
+    def lod_distance(self, view):
+        """Gap between the area the tentacle can reach and the `view` rect."""
+        return max(0, distance_to_rect(self.anchor_pos, view) - self.total_length)
 
     def draw(self, screen, camera):
+        """Draw the tentacle; returns the screen rect it touched."""
         if self.is_active:
             color = (0, 0, 255)  # Base blue color
-            for i in range(len(self.points) - 1):
-                start_pos = camera.apply(self.points[i])
-                end_pos = camera.apply(self.points[i + 1])
-                pygame.draw.line(screen, color, start_pos, end_pos, 5)
+            drawn = []
+            for i in range(len(self.render_points) - 1):
+                start_pos = camera.apply(self.render_points[i])
+                end_pos = camera.apply(self.render_points[i + 1])
+                drawn.append(pygame.draw.line(screen, color, start_pos, end_pos, 5))
             
             head_color = {
                 "stalking": (0, 0, 150),
@@ -299,8 +321,9 @@ class SmartBlueTentacle:
                 "recovering": (0, 0, 100)
             }.get(self.state, (0, 0, 100))
             
-            pygame.draw.circle(screen, head_color, camera.apply(self.points[0]), 5)
+            drawn.append(pygame.draw.circle(screen, head_color, camera.apply(self.render_points[0]), 5))
             if self.has_coin:
-                pygame.draw.circle(screen, (255, 165, 0), camera.apply(self.points[0]), 8)
+                drawn.append(pygame.draw.circle(screen, (255, 165, 0), camera.apply(self.render_points[0]), 8))
+            return drawn[0].unionall(drawn[1:])
         else:
-            pygame.draw.circle(screen, (0, 0, 255), camera.apply(self.anchor_pos), 10)
\ No newline at end of file
+            return pygame.draw.circle(screen, (0, 0, 255), camera.apply(self.anchor_pos), 10)
\ No newline at end of file
@@ -3,6 +3,12 @@ import math
 import random
 import json
 import os
+from narrowphase import first_point_hit
+from points_view import PointsView
+from rope_sprites import RopeSpriteAtlas
+from rope_world import RopeWorld
+from sim_lod import DORMANT, FULL, REDUCED, distance_to_rect
+from spatial_hash import boxes_overlap, grow_box, view_box
 
 class QTableManager:
     _instance = None
@@ -65,12 +71,28 @@ class QTableManager:
 
 class SmartVerletRope:
     visual_cache = {}
+    sprite_atlas = RopeSpriteAtlas()
     cache_counter = 0
-
-    def __init__(self, anchor_pos, points, segment_length):
+    # Constraint passes per simulation tier; dormant ropes are not updated
+    LOD_ITERATIONS = {FULL: 3, REDUCED: 1}
+    # Drawing detail, lowered by the QualityGovernor under load
+    TEXTURE_PASSES = 3
+    DRAW_HAIRS = True
+    DRAW_BULGES = True
+
+    def __init__(self, anchor_pos, points, segment_length, visuals=None, world=None):
         self.rope_id = SmartVerletRope.cache_counter
         SmartVerletRope.cache_counter += 1
         
+        # Points and velocities live in a shared RopeWorld; a rope on its own
+        # gets a private world that steps it immediately
+        self.world = world if world is not None else RopeWorld(capacity=1, max_points=points, deferred=False)
+        self.slot = self.world.add_rope(points)
+        self.points = PointsView(self.world, 'points', self.slot)
+        self.velocities = PointsView(self.world, 'velocities', self.slot)
+        # Positions between the last two physics steps, used for drawing
+        self.render_points = PointsView(self.world, 'render_points', self.slot)
+        
         # Initialize learning parameters
         self.learning_rate = 0.1
         self.discount_factor = 0.95
@@ -87,14 +109,18 @@ class SmartVerletRope:
         
         self.reset_state(anchor_pos, points, segment_length)
         
-        if self.rope_id not in SmartVerletRope.visual_cache:
+        if visuals is not None:
+            # Reuse recorded visuals so a restored rope looks exactly the same
+            SmartVerletRope.visual_cache[self.rope_id] = visuals
+        elif self.rope_id not in SmartVerletRope.visual_cache:
             self.initialize_visuals(points, segment_length)
+        self.world.set_wiggle(self.slot, self.visuals['wiggle_amplitudes'],
+                              self.visuals['wiggle_frequencies'], self.visuals['wiggle_phases'])
         
         self.is_visible = True
+        self.lod_tier = FULL
 
     def reset_state(self, anchor_pos, points, segment_length):
-        self.points = [pygame.Vector2(anchor_pos) for _ in range(points)]
-        self.velocities = [pygame.Vector2(0, 0) for _ in range(points)]
         self.segment_length = segment_length
         self.total_length = segment_length * points
         self.anchor_pos = pygame.Vector2(anchor_pos)
@@ -114,6 +140,10 @@ class SmartVerletRope:
         self.gravity = pygame.Vector2(0, 0.15)
         
         self.time = 0
+        # Drives the hair sway; advances every step, unlike
+        # `time`, the wiggle phase, which pauses while the rope strikes
+        self.draw_time = 0
+        self.world.reset_rope(self.slot, self.anchor_pos, segment_length, self.damping)
 
     def get_state(self, distance_to_target):
         if distance_to_target > self.total_length * 1.5:
@@ -159,20 +189,21 @@ class SmartVerletRope:
         
         self.q_manager.update_q_value(self.current_state, action, new_value)
 
-    def update(self, mouse_pos, chain_end):
-        if not self.is_visible:
+    def update(self, mouse_pos, chain_end, dt=0.016):
+        if self.lod_tier == DORMANT:
             return
 
         if not self.is_active:
             if (chain_end - self.anchor_pos).length() <= self.total_length:
                 self.is_active = True
+                SmartVerletRope.sprite_atlas.add_rope()
 
         if self.is_active:
             current_head = self.points[0]
             distance_to_target = (pygame.Vector2(mouse_pos) - current_head).length()
             
             new_state = self.get_state(distance_to_target)
-            if self.is_visible:  # Only learn when visible
+            if self.lod_tier == FULL:  # Only think and learn near the view
                 action = self.choose_action(new_state)
                 hit_success = False
 
@@ -189,7 +220,7 @@ class SmartVerletRope:
                 self.previous_distance = distance_to_target
                 self.current_state = new_state
 
-            self._update_physics()
+            self._update_physics(dt)
 
     def _execute_stalk_action(self, target_pos):
         self.state = "stalking"
@@ -218,51 +249,32 @@ class SmartVerletRope:
         
         return direction.length() < 20
 
-    def _update_physics(self):
-        if self.state != "striking":
-            self.apply_idle_motion()
-
-        for i in range(len(self.points) - 1):
-            if i != len(self.points) - 1:
-                self.velocities[i] *= self.damping
-            self.points[i] += self.velocities[i]
+    def _update_physics(self, dt=0.016):
+        # Idle wiggle, integration and the 3 constraint passes run batched in the RopeWorld
+        idle = self.state != "striking"
+        if idle:
+            self.time += dt
+        self.draw_time += dt
+        self.world.queue(self.slot, idle, self.time, self.LOD_ITERATIONS[self.lod_tier])
 
-        for _ in range(3):
-            for i in range(1, len(self.points)):
-                self.points[i] = self.constrain_distance(self.points[i], self.points[i - 1])
-            self.points[-1] = self.anchor_pos
-            for i in range(len(self.points) - 2, -1, -1):
-                self.points[i] = self.constrain_distance(self.points[i], self.points[i + 1])
+    def lod_distance(self, view):
+        """Gap between the area the rope can reach and the `view` rect."""
+        return max(0, distance_to_rect(self.anchor_pos, view) - self.total_length)
 
-    def constrain_distance(self, point, anchor):
-        direction = point - anchor
-        dist = direction.length()
-        if dist > self.segment_length:
-            normalized = direction / dist
-            return anchor + normalized * self.segment_length
-        return point
+    @property
+    def aabb(self):
+        """(left, top, right, bottom) of the rope as of its last physics step."""
+        return self.world.aabbs[self.slot].tolist()
 
-    def is_in_view(self, camera, window_size):
-        for point in self.points:
-            screen_pos = camera.apply(point)
-            if (0 <= screen_pos.x <= window_size[0] and 
-                0 <= screen_pos.y <= window_size[1]):
-                return True
-        
-        if not self.is_active:
-            screen_pos = camera.apply(self.anchor_pos)
-            if (0 <= screen_pos.x <= window_size[0] and 
-                0 <= screen_pos.y <= window_size[1]):
-                return True
-        
-        return False
+    @property
+    def bounding_circle(self):
+        """(x, y, radius) circle holding the rope as of its last physics step."""
+        return self.world.bounding_circle(self.slot)
 
     def check_collision_with_chain(self, chain):
-        for joint in chain.joints:
-            for point in self.points:
-                if (point - pygame.Vector2(joint)).length() < 5:
-                    return True
-        return False
+        if not boxes_overlap(grow_box(self.aabb, 5), chain.aabb):
+            return False
+        return first_point_hit(chain.joint_array(), self.points.array(), 5) is not None
 
     # [Previous visual methods remain unchanged]
     def initialize_visuals(self, points, segment_length):
@@ -288,123 +300,59 @@ class SmartVerletRope:
     def visuals(self):
         return SmartVerletRope.visual_cache[self.rope_id]
 
-    def apply_idle_motion(self):
-        self.time += 0.016
-        for i in range(len(self.points) - 1):
-            base_pos = self.points[i + 1]
-            angle = (self.time * self.visuals['wiggle_frequencies'][i] + self.visuals['wiggle_phases'][i])
-            perpendicular = pygame.Vector2(-math.sin(angle), math.cos(angle))
-            amplitude = self.visuals['wiggle_amplitudes'][i] * (1 - i / len(self.points))
-            wiggle_offset = perpendicular * amplitude * self.segment_length
-            target_pos = base_pos + wiggle_offset
-            self.velocities[i] += (target_pos - self.points[i]) * 0.1
-            if random.random() < 0.05:
-                random_force = pygame.Vector2(random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
-                self.velocities[i] += random_force
-
     @classmethod
     def clear_cache(cls):
         cls.visual_cache.clear()
+        cls.sprite_atlas.clear()
         cls.cache_counter = 0
 
-    def get_perpendicular(self, point1, point2, thickness):
-        """Get perpendicular points for thickness."""
-        direction = point2 - point1
-        if direction.length() == 0:
-            return None
-        perp = pygame.Vector2(-direction.y, direction.x)
-        perp.scale_to_length(thickness)
-        return perp
-
-    def draw_organic_segment(self, screen, camera, p1, p2, thickness1, thickness2):
-        """Draw a single organic segment with texture."""
-        if thickness1 <= 0 or thickness2 <= 0:
-            return
-
-        perp1 = self.get_perpendicular(p1, p2, thickness1)
-        perp2 = self.get_perpendicular(p1, p2, thickness2)
-        if perp1 is None or perp2 is None:
-            return
-        
-        time_offset = self.time * 0.1
-        points = [
-            camera.apply(p1 + perp1),
-            camera.apply(p2 + perp2),
-            camera.apply(p2 - perp2),
-            camera.apply(p1 - perp1)
-        ]
-
-        pygame.draw.polygon(screen, self.visuals['base_color'], points)
-
-        for _ in range(3):
-            offset = random.uniform(-2, 2)
-            texture_points = [
-                (
-                    p[0] + math.sin(time_offset + i) * offset,
-                    p[1] + math.cos(time_offset + i) * offset
-                ) for i, p in enumerate(points)
-            ]
-            pygame.draw.polygon(screen, self.visuals['highlight_color'], texture_points, 1)
-
-    def draw_hairs(self, screen, camera, point, angle, thickness):
-        """Draw organic-looking hairs/tendrils."""
-        num_hairs = 3
-        for i in range(num_hairs):
-            base_angle = angle + random.uniform(-math.pi/4, math.pi/4)
-            hair_length = thickness * random.uniform(1.5, 2.5)
-            wave = math.sin(self.time * self.visuals['hair_waves'][i] + i)
-            
-            points = []
-            steps = 5
-            for step in range(steps):
-                t = step / (steps - 1)
-                offset_angle = base_angle + wave * t * math.pi/4
-                x = point.x + math.cos(offset_angle) * hair_length * t
-                y = point.y + math.sin(offset_angle) * hair_length * t
-                points.append(camera.apply(pygame.Vector2(x, y)))
-            
-            if len(points) >= 2:
-                pygame.draw.lines(screen, self.visuals['hair_color'], False, points, max(1, int(thickness * 0.15)))
-
-    def draw_bulge(self, screen, camera, center, radius):
-        """Draw organic bulge/growth."""
-        pos = camera.apply(center)
-        pygame.draw.circle(screen, self.visuals['highlight_color'], pos, radius)
-        
-        for _ in range(3):
-            offset = random.uniform(-2, 2)
-            pygame.draw.circle(screen, self.visuals['base_color'],
-                (pos[0] + offset, pos[1] + offset),
-                radius * random.uniform(0.5, 0.8))
+    def blit_sprite(self, screen, camera, sprite, center):
+        """Blit an atlas sprite centered on a world position."""
+        x, y = camera.apply(center)
+        return screen.blit(sprite, (round(x - sprite.get_width() / 2), round(y - sprite.get_height() / 2)))
 
     def draw(self, screen, camera):
+        """Draw the rope; returns the screen rect it touched, or None."""
         if not self.is_active:
-            pygame.draw.circle(screen, self.visuals['base_color'], 
-                             camera.apply(self.anchor_pos), 10)
-            return
+            return pygame.draw.circle(screen, self.visuals['base_color'], 
+                                      camera.apply(self.anchor_pos), 10)
 
-        self.time += 0.016
+        # Nothing drawn reaches much more than five base thicknesses past the points
+        visuals = self.visuals
+        if not boxes_overlap(grow_box(self.aabb, visuals['thickness'][0] * 5 + 10),
+                             view_box(camera, screen.get_size())):
+            return None
 
-        for i in range(len(self.points) - 1):
-            p1, p2 = self.points[i], self.points[i + 1]
+        # Segments, hairs and bulges are blitted from pre-rendered sprites
+        atlas = SmartVerletRope.sprite_atlas
+        waves = atlas.hair_waves(self, self.draw_time)
+        drawn = []
+        render_points = list(self.render_points)
+        for i in range(len(render_points) - 1):
+            p1, p2 = render_points[i], render_points[i + 1]
             
-            thickness1 = self.visuals['thickness'][i] * (1 + math.sin(self.time + i) * 0.1)
-            thickness2 = self.visuals['thickness'][i + 1] * (1 + math.sin(self.time + i + 1) * 0.1)
+            # Sprites use the steady thickness: a pulse of a few percent moves it
+            # by less than a pixel but would change every sprite key
+            thickness1 = visuals['thickness'][i]
+            thickness2 = visuals['thickness'][i + 1]
             
-            if i in self.visuals['bulge_locations']:
-                bulge_index = self.visuals['bulge_locations'].index(i)
-                thickness1 *= self.visuals['bulge_sizes'][bulge_index]
-                thickness2 *= self.visuals['bulge_sizes'][bulge_index]
+            if i in visuals['bulge_locations']:
+                bulge_index = visuals['bulge_locations'].index(i)
+                thickness1 *= visuals['bulge_sizes'][bulge_index]
+                thickness2 *= visuals['bulge_sizes'][bulge_index]
             
-            self.draw_organic_segment(screen, camera, p1, p2, thickness1, thickness2)
+            angle = math.atan2(p2.y - p1.y, p2.x - p1.x)
+            if thickness1 > 0 and thickness2 > 0 and p1 != p2:
+                sprite = atlas.segment(self, p1.distance_to(p2), thickness1, thickness2, angle,
+                                       self.TEXTURE_PASSES)
+                drawn.append(self.blit_sprite(screen, camera, sprite, (p1 + p2) * 0.5))
             
-            if i % 2 == 0:
-                angle = math.atan2(p2.y - p1.y, p2.x - p1.x)
-                self.draw_hairs(screen, camera, p1, angle, thickness1)
+            if self.DRAW_HAIRS and i % 2 == 0:
+                drawn.append(self.blit_sprite(screen, camera, atlas.hairs(self, thickness1, angle, waves), p1))
             
-            if i in self.visuals['bulge_locations']:
+            if self.DRAW_BULGES and i in visuals['bulge_locations']:
                 bulge_pos = (p1 + p2) * 0.5
-                self.draw_bulge(screen, camera, bulge_pos, thickness1 * 1.5)
+                drawn.append(self.blit_sprite(screen, camera, atlas.bulge(self, thickness1 * 1.5), bulge_pos))
 
         head_color = {
             "stalking": tuple(c * 0.8 for c in self.visuals['base_color']),
@@ -412,6 +360,6 @@ class SmartVerletRope:
             "recovering": tuple(c * 0.6 for c in self.visuals['base_color'])
         }.get(self.state, self.visuals['base_color'])
         
-        head_pos = camera.apply(self.points[0])
+        head_pos = camera.apply(render_points[0])
         head_radius = self.visuals['thickness'][0] * 1.2
-        pygame.draw.circle(screen, head_color, head_pos, head_radius)
\ No newline at end of file
+        return pygame.draw.circle(screen, head_color, head_pos, head_radius).unionall(drawn)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import math
+
+def grow_box(box, margin):
+    left, top, right, bottom = box
+    return (left - margin, top - margin, right + margin, bottom + margin)
+
+def boxes_overlap(a, b):
+    """Whether two (left, top, right, bottom) boxes overlap, edges included."""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+def box_contains(outer, inner):
+    return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+            inner[2] <= outer[2] and inner[3] <= outer[3])
+
+def box_of_points(points):
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+def circle_around_box(box, points):
+    """(x, y, radius) circle around the box center that holds every point."""
+    x = (box[0] + box[2]) / 2
+    y = (box[1] + box[3]) / 2
+    return (x, y, max(math.hypot(point[0] - x, point[1] - y) for point in points))
+
+def view_box(camera, window_size):
+    """World-space box of what the camera currently shows."""
+    offset = camera.render_offset
+    return (offset.x, offset.y, offset.x + window_size[0], offset.y + window_size[1])
+
+class SpatialHash:
+    """Uniform grid over the world that buckets entities by their bounding box.
+
+    Boxes are (left, top, right, bottom) in world coordinates. Moving an entity
+    only touches the grid when the range of cells it covers changes, so
+    entities that stay put (or move within their cells) cost one comparison per
+    update. `query()` returns every entity sharing a cell with a box.
+    """
+
+    def __init__(self, world_size, cell_size=128):
+        self.cell_size = cell_size
+        self.cols = math.ceil(world_size[0] / cell_size)
+        self.rows = math.ceil(world_size[1] / cell_size)
+        self.cells = {}
+        self.spans = {}
+
+    def span(self, box):
+        """Range of cells (col0, row0, col1, row1) a box covers, clamped to the grid."""
+        left, top, right, bottom = box
+        return (min(max(int(left // self.cell_size), 0), self.cols - 1),
+                min(max(int(top // self.cell_size), 0), self.rows - 1),
+                min(max(int(right // self.cell_size), 0), self.cols - 1),
+                min(max(int(bottom // self.cell_size), 0), self.rows - 1))
+
+    def update(self, entity, box):
+        span = self.span(box)
+        old_span = self.spans.get(entity)
+        if span == old_span:
+            return
+        if old_span is not None:
+            self._unlink(entity, old_span)
+        self.spans[entity] = span
+        col0, row0, col1, row1 = span
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                self.cells.setdefault((col, row), set()).add(entity)
+
+    def remove(self, entity):
+        span = self.spans.pop(entity, None)
+        if span is not None:
+            self._unlink(entity, span)
+
+    def _unlink(self, entity, span):
+        col0, row0, col1, row1 = span
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                cell = self.cells[(col, row)]
+                cell.discard(entity)
+                if not cell:
+                    del self.cells[(col, row)]
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+
+    def query(self, box):
+        """Every entity in a cell the box touches (a superset of true overlaps)."""
+        col0, row0, col1, row1 = self.span(box)
+        found = set()
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                cell = self.cells.get((col, row))
+                if cell:
+                    found |= cell
+        return found
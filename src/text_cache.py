@@ -0,0 +1,44 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    """Fonts and rendered text surfaces kept across frames.
+
+    Fonts are looked up once per (name, size). Rendered text is keyed by
+    (font name, size, text, color), and the least recently used surfaces are
+    dropped once there are more than `capacity`, so changing messages cannot
+    grow the cache without bound.
+    """
+
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, name, size):
+        key = (name, size)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.SysFont(name, size)
+        return self.fonts[key]
+
+    def render(self, text, size, color, name=None):
+        key = (name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.surfaces[key] = self.font(name, size).render(text, True, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.fonts.clear()
+        self.surfaces.clear()
+
+# Shared by the menu and the game screens
+text_cache = TextCache()
+
+def render_text(text, size, color, name=None):
+    """Antialiased text surface, rendered once and then reused."""
+    return text_cache.render(text, size, color, name)
@@ -0,0 +1,36 @@
+from spatial_hash import SpatialHash, boxes_overlap, grow_box, view_box
+
+class ViewCuller:
+    """Finds the entities whose bounds fall within the camera's view.
+
+    Entity boxes are kept in a coarse SpatialHash, so `visible()` only looks at
+    the cells under the view instead of at every entity. The view is grown by
+    `margin` on every side, so entities count as visible a little before they
+    scroll on screen.
+    """
+
+    def __init__(self, camera, world_size, cell_size=256, margin=50):
+        self.camera = camera
+        self.margin = margin
+        self.grid = SpatialHash(world_size, cell_size)
+        self.boxes = {}
+
+    def update(self, entity, box):
+        self.boxes[entity] = box
+        self.grid.update(entity, box)
+
+    def remove(self, entity):
+        self.boxes.pop(entity, None)
+        self.grid.remove(entity)
+
+    def clear(self):
+        self.boxes.clear()
+        self.grid.clear()
+
+    def view(self):
+        """World-space box of the camera's view, grown by the margin."""
+        return grow_box(view_box(self.camera, self.camera.window_size), self.margin)
+
+    def visible(self):
+        view = self.view()
+        return {entity for entity in self.grid.query(view) if boxes_overlap(self.boxes[entity], view)}
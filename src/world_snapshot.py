@@ -0,0 +1,65 @@
+from Chain import Chain
+from coin import Coin
+from rope_world import RopeWorld
+from SlimeObstacle import SlimeObstacle
+from slime_world import SlimeWorld
+from smart_blue_tentacle import SmartBlueTentacle
+from smart_verlet_rope import SmartVerletRope
+
+class WorldSnapshot:
+    """Compact record of a freshly built world that can be restored for an
+    instant same-level restart.
+
+    Only constructor arguments and the randomized per-entity parameters are
+    kept (rope visuals, tentacle wiggle), so restoring rebuilds every object in
+    its initial state without rerunning level generation.
+    """
+
+    def __init__(self, ropes, slimes, tentacles, chain, coin, chain_class=Chain):
+        self.ropes = ropes
+        self.slimes = slimes
+        self.tentacles = tentacles
+        self.chain = chain
+        self.chain_class = chain_class
+        self.coin = coin
+
+    @classmethod
+    def capture(cls, slimes, chain, ropes, blue_tentacles, coin):
+        """Record the world right after it was built, before any update ran."""
+        return cls(
+            ropes=[((rope.anchor_pos.x, rope.anchor_pos.y), len(rope.points), rope.segment_length,
+                    rope.visuals) for rope in ropes],
+            slimes=[((slime.position.x, slime.position.y), slime.radius, slime.points, slime.baked)
+                    for slime in slimes],
+            tentacles=[((tentacle.anchor_pos.x, tentacle.anchor_pos.y), len(tentacle.points),
+                        tentacle.segment_length,
+                        (tuple(tentacle.wiggle_amplitudes), tuple(tentacle.wiggle_frequencies),
+                         tuple(tentacle.wiggle_phases)))
+                       for tentacle in blue_tentacles],
+            chain=(tuple(chain.joints[0]), len(chain.joints), chain.length, chain.max_angle),
+            chain_class=type(chain),
+            coin=((coin.position.x, coin.position.y), coin.radius, coin.follow_distance),
+        )
+
+    def restore(self):
+        """Rebuild (slimes, chain, ropes, blue_tentacles, coin) in their initial state."""
+        SmartVerletRope.clear_cache()
+        rope_world = RopeWorld(capacity=max(1, len(self.ropes)))
+        ropes = [SmartVerletRope(anchor, points, segment_length, visuals=visuals, world=rope_world)
+                 for anchor, points, segment_length, visuals in self.ropes]
+        slime_world = SlimeWorld(capacity=max(1, len(self.slimes)))
+        slimes = [SlimeObstacle(position, radius, points, world=slime_world, baked=baked)
+                  for position, radius, points, baked in self.slimes]
+
+        blue_tentacles = []
+        for anchor, points, segment_length, (amplitudes, frequencies, phases) in self.tentacles:
+            tentacle = SmartBlueTentacle(anchor, points=points, segment_length=segment_length)
+            tentacle.wiggle_amplitudes = list(amplitudes)
+            tentacle.wiggle_frequencies = list(frequencies)
+            tentacle.wiggle_phases = list(phases)
+            blue_tentacles.append(tentacle)
+
+        chain = self.chain_class(*self.chain)
+        position, radius, follow_distance = self.coin
+        coin = Coin(position, radius=radius, follow_distance=follow_distance)
+        return slimes, chain, ropes, blue_tentacles, coin
@@ -0,0 +1,49 @@
+import random
+import pygame
+import pytest
+from narrowphase import first_point_hit, first_segment_hit
+from SlimeObstacle import SlimeObstacle
+
+def loop_point_hit(points, targets, radius):
+    """The rope check's original double loop."""
+    for i, point in enumerate(points):
+        for j, target in enumerate(targets):
+            if (pygame.Vector2(target) - pygame.Vector2(point)).length() < radius:
+                return i, j
+    return None
+
+def loop_segment_hit(points, ring, radius):
+    """The slime check's original double loop over the closed ring's edges."""
+    for i, point in enumerate(points):
+        for j in range(len(ring)):
+            start = pygame.Vector2(ring[j])
+            end = pygame.Vector2(ring[(j + 1) % len(ring)])
+            if SlimeObstacle.point_to_line_distance(None, pygame.Vector2(point), start, end) < radius:
+                return i, j
+    return None
+
+def random_points(rng, count, spread):
+    return [(rng.uniform(0, spread), rng.uniform(0, spread)) for _ in range(count)]
+
+@pytest.mark.parametrize('seed', range(200))
+def test_first_point_hit_matches_loop(seed):
+    rng = random.Random(seed)
+    joints = random_points(rng, rng.randint(1, 6), 40)
+    rope = random_points(rng, rng.randint(1, 12), 40)
+    assert first_point_hit(joints, rope, 5) == loop_point_hit(joints, rope, 5)
+
+@pytest.mark.parametrize('seed', range(200))
+def test_first_segment_hit_matches_loop(seed):
+    rng = random.Random(seed)
+    joints = random_points(rng, rng.randint(1, 6), 120)
+    ring = random_points(rng, rng.randint(2, 20), 120)
+    if seed % 4 == 0:
+        # Zero-length edges measure the distance to their start point
+        ring[1] = ring[0]
+    ends = ring[1:] + ring[:1]
+    assert first_segment_hit(joints, ring, ends, 15) == loop_segment_hit(joints, ring, 15)
+
+def test_empty_inputs_never_hit():
+    assert first_point_hit([], [(0, 0)], 5) is None
+    assert first_point_hit([(0, 0)], [], 5) is None
+    assert first_segment_hit([], [(0, 0)], [(1, 0)], 15) is None
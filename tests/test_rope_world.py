@@ -0,0 +1,92 @@
+import math
+import random
+import numpy as np
+import pygame
+import pytest
+from rope_world import RopeWorld
+
+DAMPING = 0.96
+JOLT = 0.25
+
+class JoltEveryStep:
+    """Stands in for the world's RNG: every wiggling point gets the same jolt."""
+
+    def random(self, size):
+        return np.zeros(size)
+
+    def uniform(self, low, high, size):
+        return np.full(size, JOLT)
+
+def vector2_step(rope, time, idle, iterations):
+    """The rope's original per-point update on pygame Vector2s, with the same jolt."""
+    points, velocities, anchor, segment = rope['points'], rope['velocities'], rope['anchor'], rope['segment']
+    n = len(points)
+    if idle:
+        for i in range(n - 1):
+            angle = time * rope['frequencies'][i] + rope['phases'][i]
+            perpendicular = pygame.Vector2(-math.sin(angle), math.cos(angle))
+            amplitude = rope['amplitudes'][i] * (1 - i / n)
+            target = points[i + 1] + perpendicular * amplitude * segment
+            velocities[i] += (target - points[i]) * 0.1
+            velocities[i] += pygame.Vector2(JOLT, JOLT)
+
+    for i in range(n - 1):
+        velocities[i] *= DAMPING
+        points[i] += velocities[i]
+
+    def constrain(point, towards):
+        direction = point - towards
+        distance = direction.length()
+        if distance > segment:
+            return towards + direction / distance * segment
+        return point
+
+    for _ in range(iterations):
+        for i in range(1, n):
+            points[i] = constrain(points[i], points[i - 1])
+        points[-1] = pygame.Vector2(anchor)
+        for i in range(n - 2, -1, -1):
+            points[i] = constrain(points[i], points[i + 1])
+
+@pytest.mark.parametrize('count', [1, 5, RopeWorld.FLOAT_BATCH_LIMIT, RopeWorld.FLOAT_BATCH_LIMIT + 8])
+def test_step_matches_vector2_rope(count):
+    rng = random.Random(count)
+    world = RopeWorld()
+    world.rng = JoltEveryStep()
+    ropes = []
+    for _ in range(count):
+        # Mixed lengths so shorter ropes sit in padded rows
+        n = rng.randint(30, 35)
+        anchor = (rng.uniform(0, 3000), rng.uniform(0, 2000))
+        segment = rng.randint(3, 7)
+        slot = world.add_rope(n)
+        world.reset_rope(slot, anchor, segment, DAMPING)
+        rope = {
+            'slot': slot, 'anchor': anchor, 'segment': segment, 'time': 0.0,
+            'amplitudes': [rng.uniform(0.1, 0.3) for _ in range(n)],
+            'frequencies': [rng.uniform(1, 3) for _ in range(n)],
+            'phases': [rng.uniform(0, 2 * math.pi) for _ in range(n)],
+            'points': [pygame.Vector2(anchor) for _ in range(n)],
+            'velocities': [pygame.Vector2(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(n)],
+        }
+        world.set_wiggle(slot, rope['amplitudes'], rope['frequencies'], rope['phases'])
+        world.velocities[slot, :n] = [tuple(velocity) for velocity in rope['velocities']]
+        ropes.append(rope)
+
+    for step in range(40):
+        for rope in ropes:
+            # Striking ropes skip the wiggle, and far ropes run one constraint pass
+            idle = rng.random() < 0.8
+            iterations = rng.choice((3, 1))
+            if idle:
+                rope['time'] += 1 / 60
+            world.queue(rope['slot'], idle, rope['time'], iterations)
+            vector2_step(rope, rope['time'], idle, iterations)
+        world.step()
+
+    for rope in ropes:
+        n = len(rope['points'])
+        for point, expected in zip(world.points[rope['slot'], :n].tolist(), rope['points']):
+            assert point == pytest.approx(tuple(expected), abs=1e-6)
+        for velocity, expected in zip(world.velocities[rope['slot'], :n].tolist(), rope['velocities']):
+            assert velocity == pytest.approx(tuple(expected), abs=1e-6)
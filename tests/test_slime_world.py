@@ -0,0 +1,55 @@
+import math
+import random
+import pygame
+import pytest
+from slime_world import SlimeWorld
+
+RADIUS = 30
+POINTS = 20
+SEGMENT_LENGTH = (2 * math.pi * RADIUS / POINTS) * 0.95
+PULSE_STRENGTH = 3.0
+
+def vector2_step(ring, position, time, iterations):
+    """The slime's original per-point update on pygame Vector2s."""
+    for i in range(len(ring)):
+        angle = 360 / len(ring) * i
+        wobble = math.sin(time + math.radians(angle)) * PULSE_STRENGTH
+        direction = (ring[i] - position).normalize()
+        ring[i] += direction * wobble
+
+    for _ in range(iterations):
+        for i in range(len(ring)):
+            next_i = (i + 1) % len(ring)
+            to_next = ring[next_i] - ring[i]
+            current_distance = to_next.length()
+            if current_distance > 0:
+                correction = (current_distance - SEGMENT_LENGTH) / current_distance
+                offset = to_next * correction * 0.5
+                ring[i] += offset
+                ring[next_i] -= offset
+            to_center = position - ring[i]
+            if to_center.length() > RADIUS:
+                ring[i] += to_center * 0.1
+
+@pytest.mark.parametrize('count', [1, 5, SlimeWorld.FLOAT_BATCH_LIMIT, SlimeWorld.FLOAT_BATCH_LIMIT + 8])
+@pytest.mark.parametrize('iterations', [20, 5])
+def test_step_matches_vector2_relaxation(count, iterations):
+    rng = random.Random(count * 100 + iterations)
+    world = SlimeWorld()
+    positions = [pygame.Vector2(rng.uniform(0, 3000), rng.uniform(0, 2000)) for _ in range(count)]
+    slots = [world.add_slime(tuple(position), RADIUS, POINTS, SEGMENT_LENGTH, PULSE_STRENGTH)
+             for position in positions]
+    rings = [[pygame.Vector2(point) for point in world.current_points[slot, :POINTS].tolist()]
+             for slot in slots]
+    times = [rng.uniform(0, 2 * math.pi) for _ in range(count)]
+
+    for _ in range(30):
+        for slot, ring, position, i in zip(slots, rings, positions, range(count)):
+            times[i] += 0.032
+            world.queue(slot, times[i], iterations)
+            vector2_step(ring, position, times[i], iterations)
+        world.step()
+
+    for slot, ring in zip(slots, rings):
+        for point, expected in zip(world.current_points[slot, :POINTS].tolist(), ring):
+            assert point == pytest.approx(tuple(expected), abs=1e-6)